@@ -124,6 +124,7 @@ def main():
         ('tests.unit.test_state_machine', 'Unit Tests - State Machine Logic'),
         ('tests.unit.test_rally_scenarios', 'Unit Tests - Rally Scenarios'),
         ('tests.unit.test_set_conditionals', 'Unit Tests - Set Conditionals'),
+        ('tests.unit.test_json_io', 'Unit Tests - JSON File Backends'),
         ('tests/test_extreme_statistics.py', 'Unit Tests - Extreme Statistics Behavior'),
     ]
     
@@ -19,6 +19,7 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 from . import __version__
 from bvsim_core.team import Team
 from bvsim_core.state_machine import simulate_point
+from bvsim_core.json_io import dump_json_file
 from bvsim_stats.models import SimulationResults
 from bvsim_stats.analysis import analyze_simulation_results, delta_skill_analysis, full_skill_analysis, sensitivity_analysis, multi_team_skill_analysis
 from bvsim_cli.templates import get_basic_template, get_advanced_template, create_team_template
@@ -1046,7 +1047,8 @@ def cmd_simulate(args):
             team_b=team_b,
             num_points=points,
             seed=args.seed,
-            show_progress=args.progress
+            show_progress=args.progress,
+            include_states=args.include_states
         )
         
         # Convert to SimulationResults format
@@ -1058,7 +1060,7 @@ def cmd_simulate(args):
                 winner=p['winner'],
                 point_type=p['point_type'],
                 duration=p['duration'],
-                states=p['states']
+                states=p.get('states')
             ))
         
         results = SimulationResults(
@@ -1069,8 +1071,7 @@ def cmd_simulate(args):
         )
         
         # Save results
-        with open(output_file, 'w') as f:
-            json.dump(results.to_dict(), f, indent=2)
+        dump_json_file(results.to_dict(), output_file, indent=True)
         print(f"\nSimulation complete. Results saved to {output_file}")
         
         # Show summary unless quiet mode
@@ -1298,6 +1299,8 @@ def main(argv=None):
     parser_simulate.add_argument('--breakdown', action='store_true', help='Include detailed breakdown')
     parser_simulate.add_argument('--progress', action='store_true', help='Show progress indicator')
     parser_simulate.add_argument('--quiet', action='store_true', help='Suppress summary output')
+    parser_simulate.add_argument('--include-states', action='store_true',
+                                 help='Save the rally trace (states) of every point')
     parser_simulate.set_defaults(func=cmd_simulate)
     
     # bvsim analyze - analyze results
@@ -15,6 +15,7 @@ from . import templates as templates_module
 from .simulation import run_large_simulation, format_simulation_summary
 from .comparison import compare_teams, format_comparison_text
 from bvsim_core.team import Team
+from bvsim_core.json_io import dump_json_file
 
 
 def cmd_create_team(args):
@@ -66,14 +67,14 @@ def cmd_run_simulation(args):
             team_b=team_b,
             num_points=args.points,
             seed=args.seed,
-            show_progress=args.progress and args.format == "text"
+            show_progress=args.progress and args.format == "text",
+            include_states=args.include_states
         )
         
         # Handle output
         if args.output:
             # Write JSON results to file
-            with open(args.output, 'w') as f:
-                json.dump(results, f, indent=2)
+            dump_json_file(results, args.output, indent=True)
             
             if args.format == "text":
                 print()
@@ -180,6 +181,8 @@ def main(argv=None):
     parser_sim.add_argument('--progress', action='store_true', help='Show progress bar')
     parser_sim.add_argument('--seed', type=int, help='Random seed for reproducibility')
     parser_sim.add_argument('--format', choices=['json', 'text'], default='text', help='Output format')
+    parser_sim.add_argument('--include-states', action='store_true',
+                            help='Include the rally trace (states) of every point in JSON output')
     parser_sim.set_defaults(func=cmd_run_simulation)
     
     # compare-teams command
@@ -12,7 +12,7 @@ from itertools import combinations
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 from bvsim_core.team import Team
-from bvsim_core.state_machine import simulate_point
+from bvsim_core.state_machine import simulate_point_summary
 
 
 def compare_teams(teams: List[Team], points_per_matchup: int = 1000) -> Dict[str, Any]:
@@ -48,9 +48,10 @@ def compare_teams(teams: List[Team], points_per_matchup: int = 1000) -> Dict[str
         for point_idx in range(points_per_matchup):
             # Alternate serving
             serving_team = "A" if point_idx % 2 == 0 else "B"
-            point = simulate_point(team_a, team_b, serving_team=serving_team, seed=point_idx)
+            # Only the winner is needed, so skip building the rally trace
+            winner = simulate_point_summary(team_a, team_b, serving_team=serving_team, seed=point_idx)
             
-            if point.winner == "A":
+            if winner == "A":
                 wins_a += 1
         
         wins_b = points_per_matchup - wins_a
@@ -3,7 +3,7 @@
 Large-scale simulation runner with progress tracking.
 """
 
-import json
+import random
 import time
 import sys
 from typing import Optional, List, Dict, Any
@@ -41,7 +41,8 @@ class ProgressBar:
 
 
 def run_large_simulation(team_a: Team, team_b: Team, num_points: int,
-                        seed: Optional[int] = None, show_progress: bool = True) -> Dict[str, Any]:
+                        seed: Optional[int] = None, show_progress: bool = True,
+                        include_states: bool = False) -> Dict[str, Any]:
     """
     Run large-scale simulation between two teams.
     
@@ -51,6 +52,8 @@ def run_large_simulation(team_a: Team, team_b: Team, num_points: int,
         num_points: Number of points to simulate
         seed: Random seed for reproducibility
         show_progress: Whether to show progress bar
+        include_states: Include the full rally trace for every point. Off by
+            default since statistics only need the per-point summary fields.
         
     Returns:
         Dictionary with simulation results
@@ -61,8 +64,17 @@ def run_large_simulation(team_a: Team, team_b: Team, num_points: int,
     if show_progress:
         progress = ProgressBar(num_points)
     
+    # Unseeded runs share one generator; seeded runs keep per-point seeds
+    # (seed + i) so results stay reproducible point by point
+    rng = random.Random() if seed is None else None
+    
+    # Preallocate the result list and count wins as points are produced,
+    # rather than growing the list and rescanning it afterwards
+    points = [None] * num_points
+    team_a_wins = 0
+    progress_interval = max(1, num_points // 100)
+    
     # Simulate points
-    points = []
     for i in range(num_points):
         # Alternate serving team
         serving_team = "A" if i % 2 == 0 else "B"
@@ -71,22 +83,27 @@ def run_large_simulation(team_a: Team, team_b: Team, num_points: int,
         point_seed = seed + i if seed is not None else None
         
         # Simulate point
-        point = simulate_point(team_a, team_b, serving_team=serving_team, seed=point_seed)
+        point = simulate_point(team_a, team_b, serving_team=serving_team, seed=point_seed, rng=rng)
+        
+        if point.winner == 'A':
+            team_a_wins += 1
         
         # Store result
-        points.append({
+        point_data = {
             'serving_team': point.serving_team,
             'winner': point.winner,
             'point_type': point.point_type,
-            'duration': len(point.states),
-            'states': [
+            'duration': len(point.states)
+        }
+        if include_states:
+            point_data['states'] = [
                 {'team': s.team, 'action': s.action, 'quality': s.quality}
                 for s in point.states
             ]
-        })
+        points[i] = point_data
         
         # Update progress
-        if show_progress and (i + 1) % max(1, num_points // 100) == 0:
+        if show_progress and (i + 1) % progress_interval == 0:
             progress.update(i + 1)
     
     # Final progress update
@@ -96,9 +113,8 @@ def run_large_simulation(team_a: Team, team_b: Team, num_points: int,
     end_time = time.time()
     duration = end_time - start_time
     
-    # Calculate basic statistics
-    team_a_wins = sum(1 for p in points if p['winner'] == 'A')
-    team_b_wins = sum(1 for p in points if p['winner'] == 'B')
+    # Every point has exactly one winner
+    team_b_wins = num_points - team_a_wins
     
     return {
         'team_a_name': team_a.name,
@@ -6,10 +6,15 @@ Team configuration templates for creating new teams.
 import yaml
 from pathlib import Path
 
+from bvsim_core.team import CSafeLoader, CSafeDumper
+
 
 # Cache for loaded templates
 _template_cache = {}
 
+# Cache for rendered template YAML (everything except the name field)
+_rendered_template_cache = {}
+
 
 def _get_template_path(template_name: str) -> Path:
     """Get path to template file"""
@@ -32,17 +37,39 @@ def _get_template_path(template_name: str) -> Path:
     raise FileNotFoundError(f"Could not find {template_name}_team_template.yaml in any of these locations: {[str(p) for p in possible_paths]}")
 
 
-def _load_template(template_name: str) -> dict:
-    """Load template from YAML file with caching"""
+def _cached_template(template_name: str) -> dict:
+    """Load template from YAML file with caching; the result must not be modified"""
     if template_name not in _template_cache:
         template_path = _get_template_path(template_name)
         
         with open(template_path, 'r') as f:
-            template_data = yaml.safe_load(f)
+            template_data = yaml.load(f, Loader=CSafeLoader)
         
         _template_cache[template_name] = template_data
     
-    return _template_cache[template_name].copy()
+    return _template_cache[template_name]
+
+
+def _load_template(template_name: str) -> dict:
+    """Load template as a copy the caller may edit"""
+    return _copy_nested(_cached_template(template_name))
+
+
+def _copy_nested(value):
+    """Copy nested dicts so callers can edit a template without touching the cache"""
+    if isinstance(value, dict):
+        return {key: _copy_nested(item) for key, item in value.items()}
+    return value
+
+
+def _render_template_body(template_name: str) -> str:
+    """Render template as YAML without its name field, with caching"""
+    if template_name not in _rendered_template_cache:
+        body = {key: value for key, value in _cached_template(template_name).items() if key != 'name'}
+        _rendered_template_cache[template_name] = yaml.dump(
+            body, Dumper=CSafeDumper, default_flow_style=False, indent=2, sort_keys=False)
+    
+    return _rendered_template_cache[template_name]
 
 
 def get_basic_template(team_name: str) -> dict:
@@ -52,6 +79,11 @@ def get_basic_template(team_name: str) -> dict:
     return template
 
 
+def get_basic_template_section(section: str) -> dict:
+    """Get a copy of one section of the basic template (empty if it has none)"""
+    return _copy_nested(_cached_template("basic").get(section, {}))
+
+
 def get_advanced_template(team_name: str) -> dict:
     """Get advanced team template with detailed probability matrices"""
     template = _load_template("advanced")
@@ -80,15 +112,20 @@ def create_team_template(team_name: str, template_type: str = "basic",
     if template_type not in ["basic", "advanced"]:
         raise ValueError(f"Invalid template type: {template_type}. Must be 'basic' or 'advanced'")
     
-    # Get template data
-    if template_type == "basic":
-        team_data = get_basic_template(team_name)
-    else:
-        team_data = get_advanced_template(team_name)
-    
-    # Interactive mode modifications
     if interactive:
+        # Get template data
+        if template_type == "basic":
+            team_data = get_basic_template(team_name)
+        else:
+            team_data = get_advanced_template(team_name)
+        
+        # Interactive mode modifications
         team_data = _interactive_team_creation(team_data)
+        yaml_text = yaml.dump(team_data, Dumper=CSafeDumper, default_flow_style=False, indent=2, sort_keys=False)
+    else:
+        # Name leads the file, so only it needs dumping; the rest is the cached template
+        yaml_text = (yaml.dump({'name': team_name}, Dumper=CSafeDumper, default_flow_style=False, indent=2, sort_keys=False)
+                     + _render_template_body(template_type))
     
     # Determine output file
     if output_file is None:
@@ -101,7 +138,7 @@ def create_team_template(team_name: str, template_type: str = "basic",
     try:
         output_path = Path(output_file)
         with open(output_path, 'w') as f:
-            yaml.dump(team_data, f, default_flow_style=False, indent=2, sort_keys=False)
+            f.write(yaml_text)
         
         return str(output_path)
         
@@ -9,12 +9,14 @@ __version__ = "1.0.0"
 
 from .team import Team
 from .point import Point
-from .state_machine import simulate_point
+from .state_machine import simulate_point, simulate_point_summary, simulate_points_batch
 from .validation import validate_team_configuration
 
 __all__ = [
     'Team',
     'Point', 
     'simulate_point',
+    'simulate_point_summary',
+    'simulate_points_batch',
     'validate_team_configuration'
 ]
\ No newline at end of file
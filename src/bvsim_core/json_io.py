@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+JSON file reading and writing for simulation results.
+
+Files are always written by the json module unless a caller opts in to
+orjson, so a results file has the same bytes whether or not orjson is
+installed. orjson is markedly faster for the large point lists simulations
+produce, but its output differs from json's:
+
+- orjson writes non-ASCII characters as UTF-8; json escapes them (\\u00eb)
+- orjson writes compact output without spaces (',' and ':'); json uses
+  ', ' and ': ' unless indenting
+- exponent floats are spelled differently (orjson 1e16, json 1e+16)
+- orjson writes NaN and Infinity as null, so opting in refuses them
+  instead of losing them
+
+Reading uses orjson when it is installed, since both backends decode the
+same values; files holding NaN or Infinity fall back to the json module.
+Files are always UTF-8 encoded.
+"""
+
+import json
+import math
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; the standard library is the fallback
+    orjson = None
+
+
+def _check_finite(data: Any) -> None:
+    """Raise ValueError if data holds a NaN or infinite float anywhere"""
+    if isinstance(data, float):
+        if not math.isfinite(data):
+            raise ValueError(f"Out of range float values are not JSON compliant: {data!r}")
+    elif isinstance(data, dict):
+        for value in data.values():
+            _check_finite(value)
+    elif isinstance(data, (list, tuple)):
+        for value in data:
+            _check_finite(value)
+
+
+def dump_json_file(data: Any, file_path: str, indent: bool = False, use_orjson: bool = False) -> None:
+    """
+    Write data to a JSON file.
+
+    Args:
+        data: JSON-serializable data
+        file_path: Path of the JSON file to write
+        indent: Pretty-print with two-space indentation
+        use_orjson: Write with orjson when it is installed, in its own format
+            (see the module docstring)
+
+    Raises:
+        ValueError: If use_orjson is set and data holds NaN or Infinity
+    """
+    if use_orjson and orjson is not None:
+        _check_finite(data)
+        Path(file_path).write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0))
+    else:
+        with open(file_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2 if indent else None)
+
+
+def load_json_file(file_path: str) -> Any:
+    """
+    Read data from a JSON file.
+
+    Args:
+        file_path: Path of the JSON file to read
+
+    Returns:
+        The decoded data
+    """
+    raw = Path(file_path).read_bytes()
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # orjson rejects the NaN / Infinity literals json writes; the
+            # json module below accepts them, and reports truly invalid files
+            pass
+    return json.loads(raw.decode('utf-8'))
@@ -23,6 +23,9 @@ class State:
     Represents a single state in a volleyball point.
     Each state captures one action by one team with its quality outcome.
     """
+    # Points keep one State per action, so drop the per-instance __dict__
+    __slots__ = ('team', 'action', 'quality')
+    
     team: str  # "A" or "B"
     action: str  # "serve", "receive", "attack", "block", "dig", etc.
     quality: str  # "excellent", "good", "poor", "error", "ace", "kill", etc.
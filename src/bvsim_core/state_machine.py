@@ -4,12 +4,177 @@ Beach volleyball point simulation state machine.
 Implements the core logic for simulating individual volleyball points using conditional probabilities.
 """
 
+import os
 import random
-from typing import Optional
-from .team import Team
+import sys
+from bisect import bisect_left
+from itertools import accumulate, starmap
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+from .team import PROBABILITY_FIELDS, Team
 from .point import Point, State
 
 
+# Distributions used when a team does not define the condition being played
+FALLBACK_RECEIVE = {"excellent": 0.4, "good": 0.4, "poor": 0.15, "error": 0.05}
+FALLBACK_SET = {"excellent": 0.28, "good": 0.48, "poor": 0.22, "error": 0.02}
+FALLBACK_ATTACK = {"kill": 0.5, "error": 0.2, "defended": 0.3}
+FALLBACK_BLOCK = {"stuff": 0.2, "deflection_to_attack": 0.15, "deflection_to_defense": 0.15, "no_touch": 0.5}
+FALLBACK_DIG_DEFLECTION = {"excellent": 0.3, "good": 0.4, "poor": 0.25, "error": 0.05}
+FALLBACK_DIG_NO_TOUCH = {"excellent": 0.25, "good": 0.35, "poor": 0.30, "error": 0.10}
+
+# A sampling table pairs a tuple of outcomes with their running cumulative
+# probabilities, so a draw is a binary search over the cumulative tuple. A
+# certain outcome has no cumulatives and is returned without a draw
+SamplingTable = Tuple[Tuple[str, ...], Tuple[float, ...]]
+
+
+class TeamTables(NamedTuple):
+    """
+    A team's probability distributions compiled for sampling.
+    
+    Conditions are resolved and fallbacks applied once, so drawing an
+    outcome is a binary search over a tuple instead of dict lookups.
+    """
+    serve: SamplingTable
+    receive: SamplingTable
+    set_by_quality: Dict[str, SamplingTable]  # keyed by reception/dig quality
+    attack_by_quality: Dict[str, SamplingTable]  # keyed by set quality
+    block: SamplingTable
+    dig_deflection: SamplingTable
+    dig_no_touch: SamplingTable
+
+
+def _intern(outcome):
+    """
+    Intern string outcomes and conditions.
+    
+    Names loaded from YAML are fresh string objects; interning them makes
+    the state machine's comparisons against its literals ("error", "kill",
+    ...) identity hits and lets every State share one object per name.
+    """
+    return sys.intern(outcome) if isinstance(outcome, str) else outcome
+
+
+def _build_table(probabilities: dict) -> SamplingTable:
+    """
+    Outcomes and their cumulative probabilities, in dict order.
+    
+    Zero-probability outcomes are dropped, so they can never be drawn; a
+    distribution left with a single certain outcome needs no draw at all.
+    """
+    nonzero = {outcome: prob for outcome, prob in probabilities.items() if prob} or probabilities
+    outcomes = tuple(map(_intern, nonzero))
+    if len(outcomes) == 1 and nonzero[outcomes[0]] >= 1.0:
+        return outcomes, ()
+    return outcomes, tuple(accumulate(nonzero.values()))
+
+
+def _tables_by_quality(conditions: dict, suffix: str) -> Dict[str, SamplingTable]:
+    """Build tables for conditions named <quality><suffix>, keyed by quality"""
+    return {
+        _intern(condition[:-len(suffix)]): _build_table(probs)
+        for condition, probs in conditions.items()
+        if condition.endswith(suffix) and probs
+    }
+
+
+def compile_team(team: Team) -> TeamTables:
+    """
+    Compile a team's probability distributions into sampling tables.
+    
+    Draws from the compiled tables follow choose_outcome's cumulative rule,
+    except that zero-probability outcomes are never picked and a certain
+    outcome is returned without consuming a random number.
+    
+    Args:
+        team: Team to compile
+        
+    Returns:
+        TeamTables for the team
+        
+    Raises:
+        ValueError: If the team has no serve distribution
+    """
+    if not team.serve_probabilities:
+        raise ValueError("Empty probability distribution")
+    
+    return TeamTables(
+        serve=_build_table(team.serve_probabilities),
+        receive=_build_table(team.receive_probabilities.get("in_play_serve") or FALLBACK_RECEIVE),
+        set_by_quality=_tables_by_quality(team.set_probabilities, "_reception"),
+        attack_by_quality=_tables_by_quality(team.attack_probabilities, "_set"),
+        block=_build_table(team.block_probabilities.get("power_attack") or FALLBACK_BLOCK),
+        dig_deflection=_build_table(team.dig_probabilities.get("deflected_attack") or FALLBACK_DIG_DEFLECTION),
+        dig_no_touch=_build_table(team.dig_probabilities.get("deflected_attack") or FALLBACK_DIG_NO_TOUCH)
+    )
+
+
+_FALLBACK_SET_TABLE = _build_table(FALLBACK_SET)
+_FALLBACK_ATTACK_TABLE = _build_table(FALLBACK_ATTACK)
+
+
+# Generator shared by unseeded points: building random.Random() seeds it from
+# the OS, which costs several points' worth of simulation. Forked worker
+# processes reseed it so they do not replay the parent's stream
+_unseeded_rng = random.Random()
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_unseeded_rng.seed)
+
+
+def _rng_for(seed: Optional[int]) -> random.Random:
+    """A generator seeded with seed, or the shared unseeded one"""
+    return _unseeded_rng if seed is None else random.Random(seed)
+
+
+def _probabilities(team: Team) -> tuple:
+    """The team's six probability dicts, in PROBABILITY_FIELDS order"""
+    return (team.serve_probabilities, team.receive_probabilities, team.set_probabilities,
+            team.attack_probabilities, team.block_probabilities, team.dig_probabilities)
+
+
+def _snapshot(value):
+    """Copy nested dicts, so later edits to the original do not show up in the copy"""
+    if isinstance(value, dict):
+        return {key: _snapshot(item) for key, item in value.items()}
+    return value
+
+
+def _team_tables(team: Team) -> TeamTables:
+    """
+    Compiled tables for team, kept on the team until its probabilities change.
+    
+    The cache holds a copy of the probabilities the tables were compiled
+    from, so edits made in place or by assigning new dicts are both noticed.
+    The check compares every probability (a few microseconds for a full
+    team), so callers look the tables up once per point or batch, never
+    per action.
+    """
+    probabilities = _probabilities(team)
+    cached = team._tables
+    if cached is None or cached[0] != probabilities:
+        cached = team._tables = (tuple(map(_snapshot, probabilities)), compile_team(team))
+    return cached[1]
+
+
+def _point_tables(team_a: Team, team_b: Team) -> Dict[str, TeamTables]:
+    """Compiled tables for both teams of a point, keyed by team letter"""
+    return {"A": _team_tables(team_a), "B": _team_tables(team_b)}
+
+
+def _draw(table: SamplingTable, rng: random.Random) -> str:
+    """Draw an outcome from a sampling table (same rule as choose_outcome)"""
+    # bisect_left finds the first cumulative >= r, i.e. the first outcome
+    # choose_outcome's r <= cumulative scan would stop at
+    outcomes, cumulatives = table
+    if not cumulatives:
+        return outcomes[0]
+    try:
+        return outcomes[bisect_left(cumulatives, rng.random())]
+    except IndexError:
+        # Fallback to last outcome if rounding errors
+        return outcomes[-1]
+
+
 def do_set(attacking_team_obj: Team, previous_quality: str, previous_action: str, rng: random.Random) -> str:
     """
     Execute a set action based on previous action quality.
@@ -23,14 +188,14 @@ def do_set(attacking_team_obj: Team, previous_quality: str, previous_action: str
     Returns:
         Set quality outcome
     """
+    return _draw_set(_team_tables(attacking_team_obj), previous_quality, rng)
+
+
+def _draw_set(tables: TeamTables, previous_quality: str, rng: random.Random) -> str:
+    """do_set on already compiled tables"""
     # Use same probabilities for dig-based sets as reception-based sets
-    condition = previous_quality + "_reception"  # treat dig same as reception
-    set_probs = attacking_team_obj.set_probabilities.get(condition, {})
-    if not set_probs:
-        # Fallback if specific condition not found
-        set_probs = {"excellent": 0.28, "good": 0.48, "poor": 0.22, "error": 0.02}
-    
-    return choose_outcome(set_probs, rng)
+    # (<quality>_reception), falling back if the condition is not defined
+    return _draw(tables.set_by_quality.get(previous_quality, _FALLBACK_SET_TABLE), rng)
 
 
 def do_attack(attacking_team_obj: Team, set_quality: str, rng: random.Random) -> str:
@@ -45,13 +210,13 @@ def do_attack(attacking_team_obj: Team, set_quality: str, rng: random.Random) ->
     Returns:
         Attack quality outcome
     """
-    attack_condition = set_quality + "_set"
-    attack_probs = attacking_team_obj.attack_probabilities.get(attack_condition, {})
-    if not attack_probs:
-        # Fallback for missing conditions
-        attack_probs = {"kill": 0.5, "error": 0.2, "defended": 0.3}
-    
-    return choose_outcome(attack_probs, rng)
+    return _draw_attack(_team_tables(attacking_team_obj), set_quality, rng)
+
+
+def _draw_attack(tables: TeamTables, set_quality: str, rng: random.Random) -> str:
+    """do_attack on already compiled tables"""
+    # <set_quality>_set condition, falling back if it is not defined
+    return _draw(tables.attack_by_quality.get(set_quality, _FALLBACK_ATTACK_TABLE), rng)
 
 
 def do_defense(defending_team_obj: Team, attack_quality: str, rng: random.Random) -> tuple[str, str]:
@@ -67,27 +232,23 @@ def do_defense(defending_team_obj: Team, attack_quality: str, rng: random.Random
         Tuple of (block_outcome, dig_outcome_or_none)
         dig_outcome_or_none is None if no dig attempted
     """
+    return _defend(_team_tables(defending_team_obj), attack_quality, rng)
+
+
+def _defend(defending_tables: TeamTables, attack_quality: str, rng: random.Random) -> tuple[str, str]:
+    """do_defense on already compiled tables"""
     if attack_quality != "defended":
         # Only defended attacks can be blocked
         return ("no_block", None)
     
     # Block attempt
-    block_probs = defending_team_obj.block_probabilities.get("power_attack", {})
-    if not block_probs:
-        # Updated fallback with new deflection types
-        block_probs = {"stuff": 0.2, "deflection_to_attack": 0.15, "deflection_to_defense": 0.15, "no_touch": 0.5}
-    
-    block_outcome = choose_outcome(block_probs, rng)
+    block_outcome = _draw(defending_tables.block, rng)
     
     if block_outcome == "stuff":
         return (block_outcome, None)  # Point ends
     elif block_outcome == "deflection_to_attack":
         # Ball deflects to attacking team's side - attacking team must dig
-        dig_probs = defending_team_obj.dig_probabilities.get("deflected_attack", {})
-        if not dig_probs:
-            dig_probs = {"excellent": 0.3, "good": 0.4, "poor": 0.25, "error": 0.05}
-        
-        dig_outcome = choose_outcome(dig_probs, rng)
+        dig_outcome = _draw(defending_tables.dig_deflection, rng)
         return (block_outcome, dig_outcome)
     elif block_outcome == "deflection_to_defense":
         # Ball deflects to defending team's side - defending team has only 2 touches
@@ -96,11 +257,7 @@ def do_defense(defending_team_obj: Team, attack_quality: str, rng: random.Random
     else:  # no_touch
         # 80% chance of dig attempt after no_touch block
         if rng.random() < 0.80:
-            dig_probs = defending_team_obj.dig_probabilities.get("deflected_attack", {})
-            if not dig_probs:
-                dig_probs = {"excellent": 0.25, "good": 0.35, "poor": 0.30, "error": 0.10}
-            
-            dig_outcome = choose_outcome(dig_probs, rng)
+            dig_outcome = _draw(defending_tables.dig_no_touch, rng)
             return (block_outcome, dig_outcome)
         else:
             return (block_outcome, None)  # Attack lands untouched
@@ -125,82 +282,73 @@ def continue_rally(states: list, attacking_team: str, defending_team: str,
     Returns:
         Complete Point object
     """
-    action_count = len(states)
+    trace = [(s.team, s.action, s.quality) for s in states]
+    tables = {name: _team_tables(team) for name, team in teams.items()}
+    winner, point_type = _continue_rally(trace, attacking_team, defending_team, tables,
+                                         dig_quality, rng, max_actions)
+    return Point(serving_team=serving_team, winner=winner, point_type=point_type,
+                 states=_trace_to_states(trace))
+
+
+def _continue_rally(trace: list, attacking_team: str, defending_team: str, tables: Dict[str, TeamTables],
+                    dig_quality: str, rng: random.Random, max_actions: int = 100) -> Tuple[str, str]:
+    """
+    Rally loop behind continue_rally.
+    
+    tables maps team names to their compiled tables. Records actions as
+    (team, action, quality) tuples in trace and returns (winner, point_type).
+    """
+    action_count = len(trace)
     
     while action_count < max_actions:
         # 1. Set (attacking team sets based on dig quality)
-        attacking_team_obj = teams[attacking_team]
-        set_quality = do_set(attacking_team_obj, dig_quality, "dig", rng)
-        states.append(State(team=attacking_team, action="set", quality=set_quality))
+        attacking_tables = tables[attacking_team]
+        set_quality = _draw_set(attacking_tables, dig_quality, rng)
+        trace.append((attacking_team, "set", set_quality))
         action_count += 1
         
         # Check for set error
         if set_quality == "error":
-            return Point(
-                serving_team=serving_team,
-                winner=defending_team,  # Defending team wins when attacking team makes set error
-                point_type="set_error",
-                states=states
-            )
+            return defending_team, "set_error"  # Defending team wins when attacking team makes set error
         
         if action_count >= max_actions:
             break
             
         # 2. Attack (attacking team attacks based on set quality)
-        attack_quality = do_attack(attacking_team_obj, set_quality, rng)
-        states.append(State(team=attacking_team, action="attack", quality=attack_quality))
+        attack_quality = _draw_attack(attacking_tables, set_quality, rng)
+        trace.append((attacking_team, "attack", attack_quality))
         action_count += 1
         
         # Check for definitive attack outcomes
         if attack_quality == "kill":
-            return Point(
-                serving_team=serving_team,
-                winner=attacking_team,
-                point_type="kill",
-                states=states
-            )
+            return attacking_team, "kill"
         elif attack_quality == "error":
-            return Point(
-                serving_team=serving_team,
-                winner=defending_team,
-                point_type="attack_error",
-                states=states
-            )
+            return defending_team, "attack_error"
         elif attack_quality == "defended":
             if action_count >= max_actions:
                 break
                 
             # 3. Defense (defending team attempts block + dig)
-            defending_team_obj = teams[defending_team]
-            block_outcome, dig_outcome = do_defense(defending_team_obj, attack_quality, rng)
+            defending_tables = tables[defending_team]
+            block_outcome, dig_outcome = _defend(defending_tables, attack_quality, rng)
             
             if block_outcome != "no_block":
-                states.append(State(team=defending_team, action="block", quality=block_outcome))
+                trace.append((defending_team, "block", block_outcome))
                 action_count += 1
                 
                 if block_outcome == "stuff":
-                    return Point(
-                        serving_team=serving_team,
-                        winner=defending_team,
-                        point_type="stuff",
-                        states=states
-                    )
+                    return defending_team, "stuff"
                 elif block_outcome == "deflection_to_attack":
                     # Ball deflected to attacking team - they must dig
                     if dig_outcome is not None:
                         if action_count >= max_actions:
                             break
                             
-                        states.append(State(team=attacking_team, action="dig", quality=dig_outcome))
+                        trace.append((attacking_team, "dig", dig_outcome))
                         action_count += 1
                         
                         if dig_outcome == "error":
-                            return Point(
-                                serving_team=serving_team,
-                                winner=defending_team,
-                                point_type="dig_error",
-                                states=states
-                            )
+                            return defending_team, "dig_error"
                         else:
                             # Rally continues - attacking team keeps attacking after dig
                             dig_quality = dig_outcome
@@ -210,43 +358,27 @@ def continue_rally(states: list, attacking_team: str, defending_team: str,
                     if action_count >= max_actions:
                         break
                         
-                    defending_team_obj = teams[defending_team]
-                    set_quality = do_set(defending_team_obj, "excellent", "block_deflection", rng)
-                    states.append(State(team=defending_team, action="set", quality=set_quality))
+                    set_quality = _draw_set(defending_tables, "excellent", rng)
+                    trace.append((defending_team, "set", set_quality))
                     action_count += 1
                     
                     # Check for set error
                     if set_quality == "error":
-                        return Point(
-                            serving_team=serving_team,
-                            winner=attacking_team,  # Attacking team wins when defending team makes set error
-                            point_type="set_error",
-                            states=states
-                        )
+                        return attacking_team, "set_error"  # Attacking team wins when defending team makes set error
                     
                     if action_count >= max_actions:
                         break
                         
                     # Immediate attack (final touch)
-                    attack_quality = do_attack(defending_team_obj, set_quality, rng)
-                    states.append(State(team=defending_team, action="attack", quality=attack_quality))
+                    attack_quality = _draw_attack(defending_tables, set_quality, rng)
+                    trace.append((defending_team, "attack", attack_quality))
                     action_count += 1
                     
                     # Check attack outcomes
                     if attack_quality == "kill":
-                        return Point(
-                            serving_team=serving_team,
-                            winner=defending_team,
-                            point_type="kill",
-                            states=states
-                        )
+                        return defending_team, "kill"
                     elif attack_quality == "error":
-                        return Point(
-                            serving_team=serving_team,
-                            winner=attacking_team,
-                            point_type="attack_error",
-                            states=states
-                        )
+                        return attacking_team, "attack_error"
                     elif attack_quality == "defended":
                         # Rally continues - teams switch roles
                         attacking_team, defending_team = defending_team, attacking_team
@@ -258,16 +390,11 @@ def continue_rally(states: list, attacking_team: str, defending_team: str,
                         if action_count >= max_actions:
                             break
                             
-                        states.append(State(team=defending_team, action="dig", quality=dig_outcome))
+                        trace.append((defending_team, "dig", dig_outcome))
                         action_count += 1
                         
                         if dig_outcome == "error":
-                            return Point(
-                                serving_team=serving_team,
-                                winner=attacking_team,
-                                point_type="dig_error",
-                                states=states
-                            )
+                            return attacking_team, "dig_error"
                         else:
                             # Rally continues - switch team roles
                             attacking_team, defending_team = defending_team, attacking_team
@@ -275,29 +402,14 @@ def continue_rally(states: list, attacking_team: str, defending_team: str,
                             continue
                     else:
                         # No dig - attack landed
-                        return Point(
-                            serving_team=serving_team,
-                            winner=attacking_team,
-                            point_type="kill",
-                            states=states
-                        )
+                        return attacking_team, "kill"
         else:
             # Undefended attack - should be kill but being safe
-            return Point(
-                serving_team=serving_team,
-                winner=attacking_team,
-                point_type="kill",
-                states=states
-            )
+            return attacking_team, "kill"
     
     # Rally hit max actions - end with rally type
     winner = rng.choice([attacking_team, defending_team])
-    return Point(
-        serving_team=serving_team,
-        winner=winner,
-        point_type="rally",
-        states=states
-    )
+    return winner, "rally"
 
 
 def choose_outcome(probabilities: dict, rng: random.Random) -> str:
@@ -326,7 +438,8 @@ def choose_outcome(probabilities: dict, rng: random.Random) -> str:
     return list(probabilities.keys())[-1]
 
 
-def simulate_point(team_a: Team, team_b: Team, serving_team: str = "A", seed: Optional[int] = None) -> Point:
+def simulate_point(team_a: Team, team_b: Team, serving_team: str = "A", seed: Optional[int] = None,
+                   rng: Optional[random.Random] = None) -> Point:
     """
     Simulate a complete volleyball point between two teams.
     
@@ -335,6 +448,9 @@ def simulate_point(team_a: Team, team_b: Team, serving_team: str = "A", seed: Op
         team_b: Team B configuration  
         serving_team: Which team serves ("A" or "B")
         seed: Random seed for reproducible results
+        rng: Random number generator to draw from instead of creating one
+            from seed. Seeding a generator costs more than simulating a
+            typical point, so callers simulating many points should share one.
         
     Returns:
         Point object with complete state progression
@@ -342,177 +458,183 @@ def simulate_point(team_a: Team, team_b: Team, serving_team: str = "A", seed: Op
     if serving_team not in ["A", "B"]:
         raise ValueError(f"Invalid serving_team: {serving_team}")
     
-    rng = random.Random(seed)
-    states = []
+    if rng is None:
+        rng = _rng_for(seed)
+    trace = []
+    winner, point_type = _play_point(_point_tables(team_a, team_b), serving_team, rng, trace)
+    return Point(serving_team=serving_team, winner=winner, point_type=point_type,
+                 states=_trace_to_states(trace))
+
+
+def simulate_point_summary(team_a: Team, team_b: Team, serving_team: str = "A", seed: Optional[int] = None,
+                           rng: Optional[random.Random] = None) -> str:
+    """
+    Simulate a point and return only its winner.
+    
+    Draws exactly the same random numbers as simulate_point, so for a given
+    seed the winner matches simulate_point(...).winner, but no State or Point
+    objects are built. Use it when only win counts are needed.
+    
+    Args:
+        team_a: Team A configuration
+        team_b: Team B configuration
+        serving_team: Which team serves ("A" or "B")
+        seed: Random seed for reproducible results
+        rng: Random number generator to draw from instead of creating one from seed
+        
+    Returns:
+        Winning team ("A" or "B")
+    """
+    if serving_team not in ["A", "B"]:
+        raise ValueError(f"Invalid serving_team: {serving_team}")
+    
+    if rng is None:
+        rng = _rng_for(seed)
+    winner, _ = _play_point(_point_tables(team_a, team_b), serving_team, rng, [])
+    return winner
+
+
+def simulate_points_batch(team_a: Team, team_b: Team, serving_team: str = "A", *,
+                          seeds: Iterable[int]) -> Tuple[List[str], List[str]]:
+    """
+    Simulate one point per seed in a single call.
+    
+    Point i is the point simulate_point would produce with seeds[i]; a
+    single generator is reseeded for each point and no rally traces are
+    kept.
+    
+    Args:
+        team_a: Team A configuration
+        team_b: Team B configuration
+        serving_team: Which team serves every point ("A" or "B")
+        seeds: Random seed for each point (required, keyword-only)
+        
+    Returns:
+        Tuple of (winners, point_types) lists, one entry per seed
+    """
+    if serving_team not in ["A", "B"]:
+        raise ValueError(f"Invalid serving_team: {serving_team}")
+    
+    tables = _point_tables(team_a, team_b)
+    rng = random.Random()
+    winners = []
+    point_types = []
+    for seed in seeds:
+        rng.seed(seed)
+        winner, point_type = _play_point(tables, serving_team, rng, [])
+        winners.append(winner)
+        point_types.append(point_type)
+    
+    return winners, point_types
+
+
+def _trace_to_states(trace: list) -> List[State]:
+    """Build State objects from (team, action, quality) tuples"""
+    # Positional arguments: keyword calls to the dataclass __init__ cost
+    # noticeably more per state
+    return list(starmap(State, trace))
+
+
+def _play_point(tables: Dict[str, TeamTables], serving_team: str, rng: random.Random,
+                trace: list) -> Tuple[str, str]:
+    """
+    Run the point state machine shared by simulate_point and simulate_point_summary.
+    
+    tables holds both teams' compiled tables (see _point_tables). Records
+    actions as (team, action, quality) tuples in trace and returns
+    (winner, point_type).
+    """
     current_team = serving_team
     receiving_team = "B" if serving_team == "A" else "A"
     
-    # Get team objects
-    teams = {"A": team_a, "B": team_b}
-    current_team_obj = teams[current_team]
-    receiving_team_obj = teams[receiving_team]
+    current_tables = tables[current_team]
+    receiving_tables = tables[receiving_team]
     
     # 1. Serve
-    serve_outcome = choose_outcome(current_team_obj.serve_probabilities, rng)
-    states.append(State(team=current_team, action="serve", quality=serve_outcome))
+    serve_outcome = _draw(current_tables.serve, rng)
+    trace.append((current_team, "serve", serve_outcome))
     
     # Check for immediate point endings
     if serve_outcome == "ace":
-        return Point(
-            serving_team=serving_team,
-            winner=current_team,
-            point_type="ace",
-            states=states
-        )
+        return current_team, "ace"
     elif serve_outcome == "error":
-        return Point(
-            serving_team=serving_team, 
-            winner=receiving_team,
-            point_type="serve_error",
-            states=states
-        )
+        return receiving_team, "serve_error"
     
     # 2. Receive (if serve was in play)
     if serve_outcome == "in_play":
         # Use in_play_serve condition for receive
-        receive_probs = receiving_team_obj.receive_probabilities.get("in_play_serve", {})
-        if not receive_probs:
-            # Fallback if condition not found
-            receive_probs = {"excellent": 0.4, "good": 0.4, "poor": 0.15, "error": 0.05}
-        
-        receive_outcome = choose_outcome(receive_probs, rng)
-        states.append(State(team=receiving_team, action="receive", quality=receive_outcome))
+        receive_outcome = _draw(receiving_tables.receive, rng)
+        trace.append((receiving_team, "receive", receive_outcome))
         
         # Check for receive error
         if receive_outcome == "error":
-            return Point(
-                serving_team=serving_team,
-                winner=current_team,
-                point_type="receive_error", 
-                states=states
-            )
+            return current_team, "receive_error"
         
-        # 3. Set (conditional on reception quality)
-        set_probs = receiving_team_obj.set_probabilities.get(receive_outcome + "_reception", {})
-        if not set_probs:
-            # Fallback if specific reception condition not found
-            set_probs = {"excellent": 0.28, "good": 0.48, "poor": 0.22, "error": 0.02}
-        
-        set_outcome = choose_outcome(set_probs, rng)
-        states.append(State(team=receiving_team, action="set", quality=set_outcome))
+        # 3. Set (conditional on reception quality, e.g. "excellent_reception")
+        set_table = receiving_tables.set_by_quality.get(receive_outcome, _FALLBACK_SET_TABLE)
+        set_outcome = _draw(set_table, rng)
+        trace.append((receiving_team, "set", set_outcome))
         
         # Check for set error
         if set_outcome == "error":
-            return Point(
-                serving_team=serving_team,
-                winner=current_team,  # Serving team wins when receiving team makes set error
-                point_type="set_error",
-                states=states
-            )
-        
-        # Determine attack probabilities based on actual set quality
-        set_quality = set_outcome + "_set"  # e.g., "excellent_set"
+            return current_team, "set_error"  # Serving team wins when receiving team makes set error
         
-        # 4. Attack
-        attack_probs = receiving_team_obj.attack_probabilities.get(set_quality, {})
-        if not attack_probs:
-            # Fallback for missing conditions
-            attack_probs = {"kill": 0.5, "error": 0.2, "defended": 0.3}
-        
-        attack_outcome = choose_outcome(attack_probs, rng)
-        states.append(State(team=receiving_team, action="attack", quality=attack_outcome))
+        # 4. Attack (conditional on actual set quality, e.g. "excellent_set")
+        attack_table = receiving_tables.attack_by_quality.get(set_outcome, _FALLBACK_ATTACK_TABLE)
+        attack_outcome = _draw(attack_table, rng)
+        trace.append((receiving_team, "attack", attack_outcome))
         
         # Check attack outcomes
         if attack_outcome == "kill":
-            return Point(
-                serving_team=serving_team,
-                winner=receiving_team,
-                point_type="kill",
-                states=states
-            )
+            return receiving_team, "kill"
         elif attack_outcome == "error":
-            return Point(
-                serving_team=serving_team,
-                winner=current_team,
-                point_type="attack_error",
-                states=states
-            )
+            return current_team, "attack_error"
         elif attack_outcome == "defended":
             # 5. Block attempt
-            block_probs = current_team_obj.block_probabilities.get("power_attack", {})
-            if not block_probs:
-                block_probs = {"stuff": 0.2, "deflection_to_attack": 0.15, "deflection_to_defense": 0.15, "no_touch": 0.5}
-            
-            block_outcome = choose_outcome(block_probs, rng)
-            states.append(State(team=current_team, action="block", quality=block_outcome))
+            block_outcome = _draw(current_tables.block, rng)
+            trace.append((current_team, "block", block_outcome))
             
             if block_outcome == "stuff":
-                return Point(
-                    serving_team=serving_team,
-                    winner=current_team,
-                    point_type="stuff",
-                    states=states
-                )
+                return current_team, "stuff"
             elif block_outcome == "deflection_to_attack":
                 # Ball deflects to attacking team's side - attacking team must dig
-                dig_probs = receiving_team_obj.dig_probabilities.get("deflected_attack", {})
-                if not dig_probs:
-                    dig_probs = {"excellent": 0.3, "good": 0.4, "poor": 0.25, "error": 0.05}
-                
-                dig_outcome = choose_outcome(dig_probs, rng)
-                states.append(State(team=receiving_team, action="dig", quality=dig_outcome))
+                dig_outcome = _draw(receiving_tables.dig_deflection, rng)
+                trace.append((receiving_team, "dig", dig_outcome))
                 
                 if dig_outcome == "error":
-                    return Point(
-                        serving_team=serving_team,
-                        winner=current_team,
-                        point_type="dig_error",
-                        states=states
-                    )
+                    return current_team, "dig_error"
                 else:
                     # Rally continues after successful dig - switch team roles
-                    return continue_rally(
-                        states=states,
+                    return _continue_rally(
+                        trace=trace,
                         attacking_team=receiving_team,  # receiving team dug, now attacks
                         defending_team=current_team,    # current team was defending, still defends
-                        teams=teams,
-                        serving_team=serving_team,
+                        tables=tables,
                         dig_quality=dig_outcome,
                         rng=rng
                     )
             elif block_outcome == "deflection_to_defense":
                 # Ball deflects to defending team's side - defending team has only 2 touches
                 # Skip dig phase, go directly to set
-                set_quality = do_set(current_team_obj, "excellent", "block_deflection", rng)
-                states.append(State(team=current_team, action="set", quality=set_quality))
+                set_quality = _draw_set(current_tables, "excellent", rng)
+                trace.append((current_team, "set", set_quality))
                 
                 # Then attack (their final touch)
-                attack_quality = do_attack(current_team_obj, set_quality, rng)
-                states.append(State(team=current_team, action="attack", quality=attack_quality))
+                attack_quality = _draw_attack(current_tables, set_quality, rng)
+                trace.append((current_team, "attack", attack_quality))
                 
                 # Check attack outcomes
                 if attack_quality == "kill":
-                    return Point(
-                        serving_team=serving_team,
-                        winner=current_team,
-                        point_type="kill",
-                        states=states
-                    )
+                    return current_team, "kill"
                 elif attack_quality == "error":
-                    return Point(
-                        serving_team=serving_team,
-                        winner=receiving_team,
-                        point_type="attack_error", 
-                        states=states
-                    )
+                    return receiving_team, "attack_error"
                 elif attack_quality == "defended":
                     # Rally continues - now receiving team defends the counter-attack
-                    return continue_rally(
-                        states=states,
+                    return _continue_rally(
+                        trace=trace,
                         attacking_team=receiving_team,  # receiving team now attacks
                         defending_team=current_team,    # current team now defends
-                        teams=teams,
-                        serving_team=serving_team,
+                        tables=tables,
                         dig_quality="excellent",  # Start new rally cycle
                         rng=rng
                     )
@@ -522,45 +644,25 @@ def simulate_point(team_a: Team, team_b: Team, serving_team: str = "A", seed: Op
                 # 80% chance of dig attempt, 20% lands untouched
                 if rng.random() < 0.80:
                     # Defending team attempts dig
-                    dig_probs = current_team_obj.dig_probabilities.get("deflected_attack", {})
-                    if not dig_probs:
-                        dig_probs = {"excellent": 0.25, "good": 0.35, "poor": 0.30, "error": 0.10}
-                    
-                    dig_outcome = choose_outcome(dig_probs, rng)
-                    states.append(State(team=current_team, action="dig", quality=dig_outcome))
+                    dig_outcome = _draw(current_tables.dig_no_touch, rng)
+                    trace.append((current_team, "dig", dig_outcome))
                     
                     if dig_outcome == "error":
-                        return Point(
-                            serving_team=serving_team,
-                            winner=receiving_team,
-                            point_type="dig_error",
-                            states=states
-                        )
+                        return receiving_team, "dig_error"
                     else:
                         # Rally continues after successful dig - switch team roles
-                        return continue_rally(
-                            states=states,
+                        return _continue_rally(
+                            trace=trace,
                             attacking_team=current_team,    # current team dug, now attacks
                             defending_team=receiving_team,  # receiving team was attacking, now defends
-                            teams=teams,
-                            serving_team=serving_team,
+                            tables=tables,
                             dig_quality=dig_outcome,
                             rng=rng
                         )
                 else:
                     # Attack lands untouched (defending team was out of position)
-                    return Point(
-                        serving_team=serving_team,
-                        winner=receiving_team,
-                        point_type="kill",
-                        states=states
-                    )
+                    return receiving_team, "kill"
     
     # Fallback - should not reach here with proper implementation
     winner = rng.choice([current_team, receiving_team])
-    return Point(
-        serving_team=serving_team,
-        winner=winner,
-        point_type="rally",
-        states=states
-    )
\ No newline at end of file
+    return winner, "rally"
\ No newline at end of file
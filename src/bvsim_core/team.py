@@ -9,6 +9,61 @@ from dataclasses import dataclass
 from typing import Dict, List, Any
 from pathlib import Path
 
+# libyaml-backed loader/dumper are several times faster; PyYAML built
+# without libyaml only ships the pure-Python ones
+try:
+    from yaml import CSafeLoader, CSafeDumper
+except ImportError:
+    from yaml import SafeLoader as CSafeLoader, SafeDumper as CSafeDumper
+
+
+# Team fields holding probability distributions
+PROBABILITY_FIELDS = (
+    'serve_probabilities',
+    'receive_probabilities',
+    'set_probabilities',
+    'attack_probabilities',
+    'block_probabilities',
+    'dig_probabilities'
+)
+
+
+# Basic template defaults, used if the template file cannot be loaded
+_FALLBACK_BASIC_DEFAULTS = {
+    'serve_probabilities': { 'ace': 0.10, 'in_play': 0.85, 'error': 0.05 },
+    'receive_probabilities': {
+        'in_play_serve': { 'excellent': 0.35, 'good': 0.40, 'poor': 0.20, 'error': 0.05 }
+    },
+    'set_probabilities': {
+        'excellent_reception': { 'excellent': 0.69, 'good': 0.25, 'poor': 0.05, 'error': 0.01 },
+        'good_reception': { 'excellent': 0.28, 'good': 0.60, 'poor': 0.10, 'error': 0.02 },
+        'poor_reception': { 'excellent': 0.05, 'good': 0.25, 'poor': 0.67, 'error': 0.03 }
+    },
+    'attack_probabilities': {
+        'excellent_set': { 'kill': 0.70, 'error': 0.15, 'defended': 0.15 },
+        'good_set': { 'kill': 0.55, 'error': 0.20, 'defended': 0.25 },
+        'poor_set': { 'kill': 0.30, 'error': 0.35, 'defended': 0.35 }
+    },
+    'block_probabilities': {
+        'power_attack': { 'stuff': 0.20, 'deflection_to_attack': 0.15, 'deflection_to_defense': 0.15, 'no_touch': 0.50 }
+    },
+    'dig_probabilities': {
+        'deflected_attack': { 'excellent': 0.30, 'good': 0.40, 'poor': 0.25, 'error': 0.05 }
+    }
+}
+
+
+def _basic_default_section(key: str) -> dict:
+    """Basic template section used when a team leaves it out"""
+    # Lazy import to avoid circular dependency (templates module imports core)
+    try:
+        from bvsim_cli.templates import get_basic_template_section  # type: ignore
+        return get_basic_template_section(key)
+    except Exception:
+        # Copy so edits to one team's section cannot reach other teams
+        return {condition: dict(probs) if isinstance(probs, dict) else probs
+                for condition, probs in _FALLBACK_BASIC_DEFAULTS.get(key, {}).items()}
+
 
 @dataclass
 class Team:
@@ -27,6 +82,12 @@ class Team:
     block_probabilities: Dict[str, Dict[str, float]]
     dig_probabilities: Dict[str, Dict[str, float]]
     
+    def __post_init__(self):
+        # Sampling tables the state machine compiles on first use, with the
+        # probabilities they were compiled from; not a dataclass field, so it
+        # stays out of fields(), asdict() and the constructor
+        self._tables = None
+    
     @classmethod
     def from_yaml_file(cls, file_path: str) -> 'Team':
         """Load team from YAML file"""
@@ -35,7 +96,7 @@ class Team:
             raise FileNotFoundError(f"Team file not found: {file_path}")
         
         with open(path, 'r') as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=CSafeLoader)
         
         return cls.from_dict(data)
     
@@ -48,52 +109,15 @@ class Team:
         its included conditions (validation handled elsewhere). This lets users
         specify only the *differences* versus the Basic template.
         """
-        # Lazy import to avoid circular dependency (templates module imports core)
-        try:
-            from bvsim_cli.templates import get_basic_template  # type: ignore
-            basic_defaults = get_basic_template("__BASIC_INTERNAL_DEFAULTS__")
-        except Exception:
-            # Fallback minimal defaults mirroring original basic template values
-            basic_defaults = {
-                'serve_probabilities': { 'ace': 0.10, 'in_play': 0.85, 'error': 0.05 },
-                'receive_probabilities': {
-                    'in_play_serve': { 'excellent': 0.35, 'good': 0.40, 'poor': 0.20, 'error': 0.05 }
-                },
-                'set_probabilities': {
-                    'excellent_reception': { 'excellent': 0.69, 'good': 0.25, 'poor': 0.05, 'error': 0.01 },
-                    'good_reception': { 'excellent': 0.28, 'good': 0.60, 'poor': 0.10, 'error': 0.02 },
-                    'poor_reception': { 'excellent': 0.05, 'good': 0.25, 'poor': 0.67, 'error': 0.03 }
-                },
-                'attack_probabilities': {
-                    'excellent_set': { 'kill': 0.70, 'error': 0.15, 'defended': 0.15 },
-                    'good_set': { 'kill': 0.55, 'error': 0.20, 'defended': 0.25 },
-                    'poor_set': { 'kill': 0.30, 'error': 0.35, 'defended': 0.35 }
-                },
-                'block_probabilities': {
-                    'power_attack': { 'stuff': 0.20, 'deflection_to_attack': 0.15, 'deflection_to_defense': 0.15, 'no_touch': 0.50 }
-                },
-                'dig_probabilities': {
-                    'deflected_attack': { 'excellent': 0.30, 'good': 0.40, 'poor': 0.25, 'error': 0.05 }
-                }
-            }
-
         merged = {}
         # Always keep provided name (or empty string)
         merged['name'] = data.get('name', '')
         # Merge each probability section: take provided if present else default
-        for key in [
-            'serve_probabilities',
-            'receive_probabilities',
-            'set_probabilities',
-            'attack_probabilities',
-            'block_probabilities',
-            'dig_probabilities'
-        ]:
+        for key in PROBABILITY_FIELDS:
             if key in data and data[key]:
                 merged[key] = data[key]
             else:
-                # Use a copy to prevent accidental mutation of cached template
-                merged[key] = basic_defaults.get(key, {}).copy()
+                merged[key] = _basic_default_section(key)
 
         return cls(
             name=merged['name'],
@@ -119,10 +143,10 @@ class Team:
     
     def to_yaml(self) -> str:
         """Serialize team to YAML format"""
-        return yaml.dump(self.to_dict(), default_flow_style=False)
+        return yaml.dump(self.to_dict(), Dumper=CSafeDumper, default_flow_style=False)
     
     @classmethod
     def from_yaml(cls, yaml_str: str) -> 'Team':
         """Deserialize team from YAML format"""
-        data = yaml.safe_load(yaml_str)
+        data = yaml.load(yaml_str, Loader=CSafeLoader)
         return cls.from_dict(data)
\ No newline at end of file
@@ -5,7 +5,6 @@ Statistical analysis functions for volleyball simulation results.
 
 import sys
 import os
-from collections import Counter
 from typing import List, Dict, Any
 import copy
 from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
@@ -16,8 +15,8 @@ import math
 # Add bvsim_core to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
-from bvsim_core.team import Team
-from bvsim_core.state_machine import simulate_point
+from bvsim_core.team import Team, CSafeLoader
+from bvsim_core.state_machine import simulate_point_summary
 from .models import SimulationResults, AnalysisResults, SensitivityResults, SensitivityDataPoint
 
 
@@ -68,20 +67,26 @@ def analyze_simulation_results(results: SimulationResults, breakdown: bool = Fal
     Returns:
         Analysis results with win rates and breakdowns
     """
-    total_points = len(results.points)
-    
-    # Count wins by team
-    team_a_wins = sum(1 for p in results.points if p.winner == "A")
-    team_b_wins = sum(1 for p in results.points if p.winner == "B")
+    points = results.points
+    total_points = len(points)
+    
+    # Count wins, point types and total duration in a single pass
+    team_a_wins = 0
+    team_b_wins = 0
+    total_duration = 0
+    point_type_breakdown = {}
+    for p in points:
+        if p.winner == "A":
+            team_a_wins += 1
+        elif p.winner == "B":
+            team_b_wins += 1
+        point_type_breakdown[p.point_type] = point_type_breakdown.get(p.point_type, 0) + 1
+        total_duration += p.duration
     
     # Calculate win rates
     team_a_win_rate = (team_a_wins / total_points) * 100 if total_points > 0 else 0
     team_b_win_rate = (team_b_wins / total_points) * 100 if total_points > 0 else 0
     
-    # Point type breakdown
-    point_type_counter = Counter(p.point_type for p in results.points)
-    point_type_breakdown = dict(point_type_counter)
-    
     # Point type percentages
     point_type_percentages = {
         point_type: (count / total_points) * 100
@@ -89,23 +94,33 @@ def analyze_simulation_results(results: SimulationResults, breakdown: bool = Fal
     } if total_points > 0 else {}
     
     # Average duration
-    total_duration = sum(p.duration for p in results.points)
     average_duration = total_duration / total_points if total_points > 0 else 0
     
     # Additional breakdown data if requested
     breakdown_data = {}
     if breakdown:
-        # Point type breakdown by team
-        team_a_point_types = Counter(p.point_type for p in results.points if p.winner == "A")
-        team_b_point_types = Counter(p.point_type for p in results.points if p.winner == "B")
+        # Per-team point types, durations by type and serve outcomes, again in one pass
+        team_a_point_types = {}
+        team_b_point_types = {}
+        durations_by_type = {point_type: [] for point_type in point_type_breakdown}
+        serving_wins = {"A": 0, "B": 0}
+        serving_total = {"A": 0, "B": 0}
+        for p in points:
+            if p.winner == "A":
+                team_a_point_types[p.point_type] = team_a_point_types.get(p.point_type, 0) + 1
+            elif p.winner == "B":
+                team_b_point_types[p.point_type] = team_b_point_types.get(p.point_type, 0) + 1
+            durations_by_type[p.point_type].append(p.duration)
+            serving_total[p.serving_team] += 1
+            if p.winner == p.serving_team:
+                serving_wins[p.serving_team] += 1
         
-        breakdown_data["team_a_point_types"] = dict(team_a_point_types)
-        breakdown_data["team_b_point_types"] = dict(team_b_point_types)
+        breakdown_data["team_a_point_types"] = team_a_point_types
+        breakdown_data["team_b_point_types"] = team_b_point_types
         
         # Duration breakdown by point type
         duration_by_type = {}
-        for point_type in point_type_breakdown.keys():
-            durations = [p.duration for p in results.points if p.point_type == point_type]
+        for point_type, durations in durations_by_type.items():
             duration_by_type[point_type] = {
                 "count": len(durations),
                 "average": sum(durations) / len(durations) if durations else 0,
@@ -115,13 +130,6 @@ def analyze_simulation_results(results: SimulationResults, breakdown: bool = Fal
         breakdown_data["duration_by_type"] = duration_by_type
         
         # Serving team advantage
-        serving_wins = {"A": 0, "B": 0}
-        serving_total = {"A": 0, "B": 0}
-        for p in results.points:
-            serving_total[p.serving_team] += 1
-            if p.winner == p.serving_team:
-                serving_wins[p.serving_team] += 1
-        
         breakdown_data["serving_advantage"] = {
             "team_a_serve_win_rate": (serving_wins["A"] / serving_total["A"] * 100) if serving_total["A"] > 0 else 0,
             "team_b_serve_win_rate": (serving_wins["B"] / serving_total["B"] * 100) if serving_total["B"] > 0 else 0,
@@ -172,7 +180,7 @@ def delta_skill_analysis(team: Team, opponent: Team, deltas_file: str, points_pe
         raise FileNotFoundError(f"Deltas file not found: {deltas_file}")
     
     with open(deltas_path, 'r') as f:
-        deltas_data = yaml.safe_load(f)
+        deltas_data = yaml.load(f, Loader=CSafeLoader)
     
     if not deltas_data:
         raise ValueError(f"Empty or invalid deltas file: {deltas_file}")
@@ -308,7 +316,7 @@ def _test_single_team_variant_file(args_tuple):
         if not path.exists():
             return team_file, None, f"Team variant file not found: {team_file}"
         with open(path, 'r') as f:
-            data = yaml.safe_load(f) or {}
+            data = yaml.load(f, Loader=CSafeLoader) or {}
         variant_team = Team.from_dict(data)
         opponent_team = Team.from_dict(opponent_dict)
         win_rate = _calculate_win_rate(variant_team, opponent_team, points_per_test, base_serving)
@@ -558,7 +566,7 @@ def set_nested_value(data: dict, path: str, value: Any) -> dict:
 
 def sensitivity_analysis(team: Team, opponent: Team, parameter: str, 
                         param_range: str, points_per_test: int = 1000,
-                        base_serving: str = "A") -> SensitivityResults:
+                        base_serving: str = "A", parallel: bool = True) -> SensitivityResults:
     """
     Perform sensitivity analysis on a team parameter.
     
@@ -569,6 +577,7 @@ def sensitivity_analysis(team: Team, opponent: Team, parameter: str,
         param_range: Range specification "min,max,step" (e.g., "0.7,0.95,0.05")
         points_per_test: Number of points to simulate per parameter value
         base_serving: Which team serves ("A" or "B")
+        parallel: Use parallel processing for the parameter sweep (default: True)
         
     Returns:
         Sensitivity analysis results
@@ -604,23 +613,35 @@ def sensitivity_analysis(team: Team, opponent: Team, parameter: str,
         param_values.sort()
     
     # Test each parameter value
+    team_dict = team.to_dict()
+    opponent_dict = opponent.to_dict()
+    value_args = [
+        (parameter, param_value, team_dict, opponent_dict, points_per_test, base_serving)
+        for param_value in param_values
+    ]
+    win_rates = None
+    
+    # Parameter values are independent, so the sweep parallelizes cleanly
+    # once each value is worth more than the process startup cost
+    max_workers = min(multiprocessing.cpu_count(), len(param_values), 8)
+    if parallel and max_workers > 1 and points_per_test >= 50000:
+        try:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                # map() preserves the order of param_values
+                win_rates = list(executor.map(_test_sensitivity_value, value_args))
+        except (OSError, RuntimeError) as e:
+            # ProcessPoolExecutor failed, fall back to sequential processing
+            print(f"Warning: Parallel processing failed ({e}), falling back to sequential")
+    
+    if win_rates is None:
+        win_rates = [_test_sensitivity_value(args) for args in value_args]
+    
     data_points = []
-    for param_value in param_values:
-        # Create modified team
-        modified_team_data = copy.deepcopy(team.to_dict())
-        
-        # Adjust probabilities to maintain valid distribution
-        modified_team_data = _adjust_probability_distribution(modified_team_data, parameter, param_value)
-        modified_team = Team.from_dict(modified_team_data)
-        
-        # Calculate win rate
-        win_rate = _calculate_win_rate(modified_team, opponent, points_per_test, base_serving)
-        change_from_base = win_rate - base_win_rate
-        
+    for param_value, win_rate in zip(param_values, win_rates):
         data_points.append(SensitivityDataPoint(
             parameter_value=param_value,
             win_rate=win_rate,
-            change_from_base=change_from_base
+            change_from_base=win_rate - base_win_rate
         ))
     
     # Calculate impact factor
@@ -642,15 +663,31 @@ def sensitivity_analysis(team: Team, opponent: Team, parameter: str,
     )
 
 
+def _test_sensitivity_value(args_tuple) -> float:
+    """Top-level helper for testing a single sensitivity value (for multiprocessing)."""
+    (parameter, param_value, team_dict, opponent_dict, points_per_test, base_serving) = args_tuple
+    
+    # Recreate team objects from dictionaries (needed for multiprocessing)
+    modified_team_data = copy.deepcopy(team_dict)
+    
+    # Adjust probabilities to maintain valid distribution
+    modified_team_data = _adjust_probability_distribution(modified_team_data, parameter, param_value)
+    modified_team = Team.from_dict(modified_team_data)
+    opponent = Team.from_dict(opponent_dict)
+    
+    return _calculate_win_rate(modified_team, opponent, points_per_test, base_serving)
+
+
 def _calculate_win_rate(team_a: Team, team_b: Team, num_points: int, base_serving: str) -> float:
     """Calculate win rate for team A over specified number of points"""
     wins = 0
+    # Unseeded run: share one generator instead of seeding a fresh one per point
+    rng = random.Random()
     
     for i in range(num_points):
         # Alternate serving
         serving_team = base_serving if i % 2 == 0 else ("B" if base_serving == "A" else "A")
-        point = simulate_point(team_a, team_b, serving_team=serving_team, seed=None)
-        if point.winner == "A":
+        if simulate_point_summary(team_a, team_b, serving_team=serving_team, rng=rng) == "A":
             wins += 1
     
     return (wins / num_points) * 100 if num_points > 0 else 0
@@ -4,8 +4,9 @@ Data models for statistical analysis results.
 """
 
 from dataclasses import dataclass
-from typing import List, Dict, Any
-import json
+from typing import List, Dict, Any, Optional
+
+from bvsim_core.json_io import load_json_file
 
 
 @dataclass
@@ -15,7 +16,8 @@ class PointResult:
     winner: str
     point_type: str
     duration: int
-    states: List[Dict[str, str]]
+    # None when the simulation ran without capturing rally traces
+    states: Optional[List[Dict[str, str]]] = None
 
 
 @dataclass 
@@ -29,8 +31,7 @@ class SimulationResults:
     @classmethod
     def from_json_file(cls, file_path: str) -> 'SimulationResults':
         """Load simulation results from JSON file"""
-        with open(file_path, 'r') as f:
-            data = json.load(f)
+        data = load_json_file(file_path)
         
         points = []
         for point_data in data['points']:
@@ -39,7 +40,8 @@ class SimulationResults:
                 winner=point_data['winner'],
                 point_type=point_data['point_type'],
                 duration=point_data['duration'],
-                states=point_data['states']
+                # Summary-only results (the default) carry no rally traces
+                states=point_data.get('states')
             )
             points.append(point)
         
@@ -52,20 +54,24 @@ class SimulationResults:
     
     def to_dict(self) -> dict:
         """Convert to dictionary"""
+        points = []
+        for p in self.points:
+            point_data = {
+                'serving_team': p.serving_team,
+                'winner': p.winner,
+                'point_type': p.point_type,
+                'duration': p.duration
+            }
+            # Leave the key out rather than write an empty trace next to a duration
+            if p.states is not None:
+                point_data['states'] = p.states
+            points.append(point_data)
+        
         return {
             'team_a_name': self.team_a_name,
             'team_b_name': self.team_b_name,
             'total_points': self.total_points,
-            'points': [
-                {
-                    'serving_team': p.serving_team,
-                    'winner': p.winner,
-                    'point_type': p.point_type,
-                    'duration': p.duration,
-                    'states': p.states
-                }
-                for p in self.points
-            ]
+            'points': points
         }
 
 
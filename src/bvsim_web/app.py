@@ -8,7 +8,7 @@ from pathlib import Path
 from flask import Flask, jsonify, request, send_file
 
 from bvsim import __version__
-from bvsim_core.team import Team
+from bvsim_core.team import Team, CSafeLoader, CSafeDumper
 from bvsim_cli.templates import get_basic_template, get_advanced_template, create_team_template
 from bvsim_cli.comparison import compare_teams, format_comparison_text
 from bvsim_cli.simulation import run_large_simulation
@@ -17,6 +17,32 @@ from bvsim_stats.analysis import analyze_simulation_results, full_skill_analysis
 
 TEAM_GLOB_PATTERNS = ["team_*.yaml", "team_*.yml", "*.yaml", "*.yml"]
 
+# Parsed team files keyed by resolved path. An entry is reused only while the
+# file's mtime and size are unchanged; endpoints that write team files also
+# drop the entry, since a quick rewrite can keep the same mtime and size.
+_team_file_cache: Dict[str, tuple] = {}
+
+
+def load_team_file(path: Path) -> Team:
+    """Team.from_yaml_file, reusing the parsed Team while the file is unchanged"""
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Team file not found: {path}") from None
+    key = str(path.resolve())
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _team_file_cache.get(key)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    team = Team.from_yaml_file(str(path))
+    _team_file_cache[key] = (stamp, team)
+    return team
+
+
+def forget_team_file(path: Path) -> None:
+    """Drop a team file from the parse cache after writing or deleting it"""
+    _team_file_cache.pop(str(path.resolve()), None)
+
 
 def list_team_files() -> List[Path]:
     files: List[Path] = []
@@ -38,7 +64,7 @@ def list_team_files() -> List[Path]:
                         if any(fragment in lowered for fragment in hidden_name_fragments):
                             continue
                     try:
-                        Team.from_yaml_file(str(p))
+                        load_team_file(p)
                         files.append(p)
                         seen.add(p.name)
                     except Exception:
@@ -70,7 +96,7 @@ def load_team(name_or_file: str) -> Team:
         for fname in search_names:
             candidate = directory / fname
             if candidate.exists():
-                return Team.from_yaml_file(str(candidate))
+                return load_team_file(candidate)
     raise FileNotFoundError(f"Team file not found: {name_or_file}")
 
 
@@ -88,7 +114,7 @@ def register_routes(app: Flask) -> None:
         teams = []
         for p in list_team_files():
             try:
-                t = Team.from_yaml_file(str(p))
+                t = load_team_file(p)
                 teams.append({"name": t.name, "file": p.name})
             except Exception as e:
                 teams.append({"file": p.name, "error": str(e)})
@@ -124,11 +150,13 @@ def register_routes(app: Flask) -> None:
                 # fallback to legacy template param
                 template_type = "advanced" if template == "advanced" else "basic"
                 create_team_template(team_name=name, template_type=template_type, output_file=output_file, interactive=False)
+                forget_team_file(out_path)
                 return jsonify({"created": True, "file": output_file, "source": template_type})
             # Write YAML manually (mirror create_team_template style) since we may have custom team_data
             import yaml
             with open(out_path, 'w') as f:
-                yaml.dump(team_data, f, default_flow_style=False, indent=2, sort_keys=False)
+                yaml.dump(team_data, f, Dumper=CSafeDumper, default_flow_style=False, indent=2, sort_keys=False)
+            forget_team_file(out_path)
             return jsonify({"created": True, "file": output_file, "source": base or template or 'basic'})
         except FileNotFoundError as e:
             return error_response(str(e), 404)
@@ -149,9 +177,10 @@ def register_routes(app: Flask) -> None:
             return error_response("Only .yaml/.yml allowed")
         content = f.read()
         path.write_bytes(content)  # overwrite allowed
+        forget_team_file(path)
         # validate
         try:
-            Team.from_yaml_file(str(path))
+            load_team_file(path)
             return jsonify({"uploaded": True, "file": path.name})
         except Exception as e:
             return error_response(f"Invalid team file: {e}", 400)
@@ -166,7 +195,7 @@ def register_routes(app: Flask) -> None:
             return error_response("Team file not found", 404)
         try:
             txt = p.read_text()
-            t = Team.from_yaml_file(str(p))
+            t = load_team_file(p)
             return jsonify({"file": p.name, "name": t.name, "content": txt})
         except Exception as e:
             return error_response(f"Failed to load team: {e}", 500)
@@ -184,7 +213,7 @@ def register_routes(app: Flask) -> None:
             name = "Advanced"
         else:
             return error_response("Unknown template kind", 404)
-        content = yaml.dump(data, default_flow_style=False, indent=2, sort_keys=False)
+        content = yaml.dump(data, Dumper=CSafeDumper, default_flow_style=False, indent=2, sort_keys=False)
         # For templates we intentionally omit a real filename so frontend can disable save
         return jsonify({"template": True, "kind": k, "name": name, "content": content})
 
@@ -200,7 +229,7 @@ def register_routes(app: Flask) -> None:
             name = "advanced_template.yaml"
         else:
             return error_response("Unknown template kind", 404)
-        content = yaml.dump(data, default_flow_style=False, indent=2, sort_keys=False).encode()
+        content = yaml.dump(data, Dumper=CSafeDumper, default_flow_style=False, indent=2, sort_keys=False).encode()
         return send_file(io.BytesIO(content), as_attachment=True, download_name=name, mimetype='text/yaml')
 
     @app.put("/api/teams/<team_file>")
@@ -215,13 +244,14 @@ def register_routes(app: Flask) -> None:
         # Basic safety: must be YAML and contain a name field
         try:
             import yaml
-            parsed = yaml.safe_load(content)
+            parsed = yaml.load(content, Loader=CSafeLoader)
             if not isinstance(parsed, dict) or 'name' not in parsed:
                 return error_response("YAML must define a 'name' field")
             # Write file
             p.write_text(content)
+            forget_team_file(p)
             # Validate by constructing Team
-            team_obj = Team.from_yaml_file(str(p))
+            team_obj = load_team_file(p)
             # Probability validation
             from bvsim_core.validation import validate_team_configuration
             val_errors = validate_team_configuration(team_obj)
@@ -240,6 +270,7 @@ def register_routes(app: Flask) -> None:
             return error_response("Team file not found", 404)
         try:
             p.unlink()
+            forget_team_file(p)
             return jsonify({"deleted": True, "file": p.name})
         except Exception as e:
             return error_response(f"Delete failed: {e}", 500)
@@ -320,7 +351,7 @@ def register_routes(app: Flask) -> None:
                     winner=p['winner'],
                     point_type=p['point_type'],
                     duration=p['duration'],
-                    states=p['states']
+                    states=p.get('states')
                 ) for p in sim_data['points']
             ]
             results = SimulationResults(
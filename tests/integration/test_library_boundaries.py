@@ -16,9 +16,10 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
 
 from bvsim_core.team import Team
 from bvsim_core.state_machine import simulate_point
+from bvsim_core.json_io import dump_json_file
 from bvsim_stats.models import SimulationResults, PointResult
 from bvsim_stats.analysis import analyze_simulation_results, sensitivity_analysis
-from bvsim_cli.templates import create_team_template
+from bvsim_cli.templates import create_team_template, get_basic_template
 from bvsim_cli.simulation import run_large_simulation
 from bvsim_cli.comparison import compare_teams
 
@@ -28,7 +29,8 @@ class TestLibraryBoundaries(unittest.TestCase):
     
     def setUp(self):
         """Set up test fixtures"""
-        self.test_dir = tempfile.mkdtemp()
+        # Context-managed temp dir is removed even if setUp or a test fails
+        self.test_dir = self.enterContext(tempfile.TemporaryDirectory())
         
         # Create sample team data
         self.team_data = {
@@ -50,11 +52,6 @@ class TestLibraryBoundaries(unittest.TestCase):
             }
         }
     
-    def tearDown(self):
-        """Clean up test files"""
-        import shutil
-        shutil.rmtree(self.test_dir)
-    
     def test_core_to_stats_data_flow(self):
         """Test that bvsim-core point data flows correctly to bvsim-stats"""
         # Create teams using bvsim-core
@@ -135,6 +132,33 @@ class TestLibraryBoundaries(unittest.TestCase):
             receive_sum = sum(probs.values())
             self.assertAlmostEqual(receive_sum, 1.0, places=3)
     
+    def test_cached_template_keeps_names_separate(self):
+        """Test that repeated template creation only changes the team name"""
+        first_file = os.path.join(self.test_dir, "first.yaml")
+        second_file = os.path.join(self.test_dir, "second.yaml")
+        create_team_template("First: Team", "advanced", first_file)
+        create_team_template("'Second' # Team", "advanced", second_file)
+        
+        first = Team.from_yaml_file(first_file)
+        second = Team.from_yaml_file(second_file)
+        
+        # Names needing YAML quoting survive the round trip
+        self.assertEqual(first.name, "First: Team")
+        self.assertEqual(second.name, "'Second' # Team")
+        self.assertEqual(first.set_probabilities, second.set_probabilities)
+        self.assertEqual(first.attack_probabilities, second.attack_probabilities)
+    
+    def test_template_edits_do_not_leak(self):
+        """Test that editing a returned template leaves later templates untouched"""
+        edited = get_basic_template("Edited Team")
+        original_ace = edited['serve_probabilities']['ace']
+        edited['serve_probabilities']['ace'] = 1.0
+        edited['attack_probabilities']['excellent_set']['kill'] = 0.0
+        
+        fresh = get_basic_template("Fresh Team")
+        self.assertEqual(fresh['serve_probabilities']['ace'], original_ace)
+        self.assertNotEqual(fresh['attack_probabilities']['excellent_set']['kill'], 0.0)
+    
     def test_cli_simulation_to_stats_pipeline(self):
         """Test complete pipeline: bvsim-cli -> bvsim-core -> bvsim-stats"""
         # Create teams using bvsim-cli
@@ -159,8 +183,7 @@ class TestLibraryBoundaries(unittest.TestCase):
         
         # Create simulation results file
         results_file = os.path.join(self.test_dir, "results.json")
-        with open(results_file, 'w') as f:
-            json.dump(results, f)
+        dump_json_file(results, results_file)
         
         # Load and analyze using bvsim-stats
         sim_results = SimulationResults.from_json_file(results_file)
@@ -175,7 +198,31 @@ class TestLibraryBoundaries(unittest.TestCase):
         # Verify statistics are consistent
         expected_a_wins = sum(1 for p in sim_results.points if p.winner == "A")
         self.assertEqual(analysis.team_a_wins, expected_a_wins)
-    
+
+    def test_simulation_states_are_opt_in(self):
+        """Test that rally traces are only emitted when requested"""
+        team_a = Team.from_dict(self.team_data)
+        team_b = Team.from_dict(self.team_data)
+
+        summary = run_large_simulation(team_a, team_b, num_points=20, seed=7, show_progress=False)
+        traced = run_large_simulation(team_a, team_b, num_points=20, seed=7, show_progress=False,
+                                      include_states=True)
+
+        # Summary-only results still load, without state lists
+        self.assertTrue(all('states' not in p for p in summary['points']))
+        results_file = os.path.join(self.test_dir, "summary.json")
+        dump_json_file(summary, results_file)
+        sim_results = SimulationResults.from_json_file(results_file)
+        self.assertTrue(all(p.states is None for p in sim_results.points))
+        
+        # Re-serializing does not invent empty traces
+        self.assertTrue(all('states' not in p for p in sim_results.to_dict()['points']))
+
+        # Traced results describe the same points
+        for summary_point, traced_point in zip(summary['points'], traced['points']):
+            self.assertEqual(summary_point['winner'], traced_point['winner'])
+            self.assertEqual(len(traced_point['states']), traced_point['duration'])
+
     def test_sensitivity_analysis_integration(self):
         """Test sensitivity analysis integrates properly with core simulation"""
         # Create teams
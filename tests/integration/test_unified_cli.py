@@ -7,9 +7,27 @@ import subprocess
 import tempfile
 import os
 import json
+from functools import cached_property
 from pathlib import Path
 
 
+class BvsimResult:
+    """Finished bvsim run; captured output is only decoded when a test reads it"""
+    
+    def __init__(self, completed):
+        self.returncode = completed.returncode
+        self._stdout = completed.stdout
+        self._stderr = completed.stderr
+    
+    @cached_property
+    def stdout(self):
+        return self._stdout.decode('utf-8', 'replace')
+    
+    @cached_property
+    def stderr(self):
+        return self._stderr.decode('utf-8', 'replace')
+
+
 def run_bvsim(args, timeout=90):
     """Run bvsim command and return result"""
     cmd = ['python3', '-m', 'bvsim'] + args
@@ -21,11 +39,10 @@ def run_bvsim(args, timeout=90):
     result = subprocess.run(
         cmd,
         capture_output=True,
-        text=True,
         timeout=timeout,
         env=env
     )
-    return result
+    return BvsimResult(result)
 
 
 def test_version():
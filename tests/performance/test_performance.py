@@ -20,8 +20,9 @@ from bvsim_cli.simulation import run_large_simulation
 class TestPerformance(unittest.TestCase):
     """Performance tests for simulation speed"""
     
-    def setUp(self):
-        """Set up test teams"""
+    @classmethod
+    def setUpClass(cls):
+        """Set up test teams shared by all timing tests"""
         team_data = {
             'name': 'Performance Test Team',
             'serve_probabilities': {'ace': 0.1, 'in_play': 0.85, 'error': 0.05},
@@ -41,10 +42,15 @@ class TestPerformance(unittest.TestCase):
             }
         }
         
-        self.team_a = Team.from_dict(team_data)
+        cls.team_a = Team.from_dict(team_data)
         team_b_data = team_data.copy()
         team_b_data['name'] = 'Performance Test Team B'
-        self.team_b = Team.from_dict(team_b_data)
+        cls.team_b = Team.from_dict(team_b_data)
+        
+        # Warm-up points compile both teams' sampling tables, so timed tests
+        # measure steady-state simulation rather than first-use setup
+        simulate_point(cls.team_a, cls.team_b, serving_team="A", seed=0)
+        simulate_point(cls.team_a, cls.team_b, serving_team="B", seed=0)
     
     def test_1000_points_performance(self):
         """Test performance of 1000 point simulation"""
@@ -124,9 +130,13 @@ class TestPerformance(unittest.TestCase):
     def test_memory_usage_stability(self):
         """Test that memory usage remains stable during large simulations"""
         import gc
+        import tracemalloc
         
         # Force garbage collection before test
         gc.collect()
+        tracemalloc.start()
+        self.addCleanup(tracemalloc.stop)
+        retained = []
         
         # Run multiple smaller simulations to check for memory leaks
         for batch in range(10):
@@ -141,6 +151,11 @@ class TestPerformance(unittest.TestCase):
             
             # Force garbage collection between batches
             gc.collect()
+            retained.append(tracemalloc.get_traced_memory()[0])
+        
+        # Only the latest batch's results should still be alive
+        growth = retained[-1] - retained[0]
+        self.assertLess(growth, 256 * 1024, f"Memory grew by {growth} bytes across batches")
         
         print(f"✅ Memory stability test passed: 10 batches of 500 points each")
     
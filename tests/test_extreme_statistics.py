@@ -4,6 +4,7 @@ Tests for extreme statistical behavior in volleyball simulation
 These tests verify that the simulation handles edge cases correctly
 """
 
+import math
 import unittest
 import sys
 from pathlib import Path
@@ -12,83 +13,92 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
 
 from bvsim_core.team import Team
-from bvsim_core.state_machine import simulate_point
+from bvsim_core.state_machine import simulate_point, simulate_point_summary, simulate_points_batch
 from bvsim_cli.templates import get_basic_template
 
+# Point types accepted by test_zero_probability_edge_case
+VALID_POINT_TYPES = frozenset({"ace", "error", "kill", "block", "stuff", "attack_error", "dig_error", "set_error"})
+
+
+def count_wins_until_decided(team_a, team_b, serving_team, winner, seeds, min_win_rate):
+    """
+    Count points won by `winner`, stopping once `min_win_rate` is out of reach.
+    
+    The count is exact whenever the rate is met; after an early stop it is a
+    lower bound, which is all a failing threshold assertion needs.
+    """
+    allowed_losses = len(seeds) - math.ceil(min_win_rate * len(seeds))
+    wins = 0
+    losses = 0
+    for seed in seeds:
+        if simulate_point_summary(team_a, team_b, serving_team=serving_team, seed=seed) == winner:
+            wins += 1
+        else:
+            losses += 1
+            if losses > allowed_losses:
+                break
+    return wins
+
 
 class TestExtremeStatistics(unittest.TestCase):
     """Test extreme statistical scenarios"""
 
+    @classmethod
+    def setUpClass(cls):
+        """Build the unmodified Basic teams once for the whole class"""
+        cls.team_a = Team.from_dict(get_basic_template("Team A"))
+        cls.team_b = Team.from_dict(get_basic_template("Team B"))
+
     def setUp(self):
         """Set up basic teams for testing"""
+        # Each call returns a fresh nested copy, so tests edit these in place
         self.team_a_template = get_basic_template("Team A")
         self.team_b_template = get_basic_template("Team B") 
         
-    def test_100_percent_ace_team_a_serving(self):
-        """Test: If Team A has 100% ace rate and starts serving, should win 100% of points"""
-        # Create team with 100% ace rate
-        team_a_data = self.team_a_template.copy()
-        team_a_data['serve_probabilities']['ace'] = 1.0
-        team_a_data['serve_probabilities']['in_play'] = 0.0
-        team_a_data['serve_probabilities']['error'] = 0.0
-        
-        team_a = Team.from_dict(team_a_data)
-        team_b = Team.from_dict(self.team_b_template)
-        
-        # Simulate multiple points with Team A serving
-        wins_a = 0
-        total_points = 100
-        
-        for i in range(total_points):
-            result = simulate_point(team_a, team_b, serving_team="A", seed=42 + i)
-            if result.winner == "A":
-                wins_a += 1
+    def test_100_percent_ace_serving_team_wins(self):
+        """Test: If the serving team has 100% ace rate, it should win 100% of points"""
+        # Zero losses in 30 points bounds the loss rate below 15% with 99% confidence;
+        # a 100% ace serve cannot lose, so any loss at all is a regression
+        total_points = 30
+        
+        for serving_team in ("A", "B"):
+            with self.subTest(serving_team=serving_team):
+                # Create team with 100% ace rate
+                server_data = get_basic_template(f"Team {serving_team}")
+                server_data['serve_probabilities']['ace'] = 1.0
+                server_data['serve_probabilities']['in_play'] = 0.0
+                server_data['serve_probabilities']['error'] = 0.0
+                server = Team.from_dict(server_data)
                 
-        win_rate = wins_a / total_points
-        self.assertGreaterEqual(win_rate, 0.99, f"Expected ~100% win rate for 100% ace, got {win_rate:.2%}")
-        
-    def test_100_percent_ace_team_b_serving(self):
-        """Test: If Team B has 100% ace rate and starts serving, should win 100% of points"""
-        # Create team with 100% ace rate
-        team_b_data = self.team_b_template.copy()
-        team_b_data['serve_probabilities']['ace'] = 1.0
-        team_b_data['serve_probabilities']['in_play'] = 0.0
-        team_b_data['serve_probabilities']['error'] = 0.0
-        
-        team_a = Team.from_dict(self.team_a_template)
-        team_b = Team.from_dict(team_b_data)
-        
-        # Simulate multiple points with Team B serving
-        wins_b = 0
-        total_points = 100
-        
-        for i in range(total_points):
-            result = simulate_point(team_a, team_b, serving_team="B", seed=42 + i)
-            if result.winner == "B":
-                wins_b += 1
+                if serving_team == "A":
+                    team_a, team_b = server, self.team_b
+                else:
+                    team_a, team_b = self.team_a, server
                 
-        win_rate = wins_b / total_points
-        self.assertGreaterEqual(win_rate, 0.99, f"Expected ~100% win rate for 100% ace, got {win_rate:.2%}")
+                # Stops early once a loss rules out the 99% threshold
+                wins = count_wins_until_decided(team_a, team_b, serving_team=serving_team, winner=serving_team,
+                                                seeds=range(42, 42 + total_points), min_win_rate=0.99)
+                
+                win_rate = wins / total_points
+                self.assertGreaterEqual(win_rate, 0.99, f"Expected ~100% win rate for 100% ace, got {win_rate:.2%}")
 
     def test_100_percent_serve_error_team_a_serving(self):
         """Test: If Team A has 100% serve error rate, should lose 100% of points when serving"""
         # Create team with 100% serve error rate
-        team_a_data = self.team_a_template.copy()
+        team_a_data = self.team_a_template
         team_a_data['serve_probabilities']['ace'] = 0.0
         team_a_data['serve_probabilities']['in_play'] = 0.0
         team_a_data['serve_probabilities']['error'] = 1.0
         
         team_a = Team.from_dict(team_a_data)
-        team_b = Team.from_dict(self.team_b_template)
+        team_b = self.team_b
         
         # Simulate multiple points with Team A serving
-        wins_b = 0
         total_points = 100
         
-        for i in range(total_points):
-            result = simulate_point(team_a, team_b, serving_team="A", seed=42 + i)
-            if result.winner == "B":
-                wins_b += 1
+        # Stops early once a loss rules out the 99% threshold
+        wins_b = count_wins_until_decided(team_a, team_b, serving_team="A", winner="B",
+                                          seeds=range(42, 42 + total_points), min_win_rate=0.99)
                 
         win_rate = wins_b / total_points
         self.assertGreaterEqual(win_rate, 0.99, f"Expected ~100% win rate for opponent when 100% serve error, got {win_rate:.2%}")
@@ -96,13 +106,13 @@ class TestExtremeStatistics(unittest.TestCase):
     def test_100_percent_reception_error_vs_in_play_serve(self):
         """Test: If Team A serves 100% in play and Team B has 100% reception error, Team A should win 100%"""
         # Team A: 100% in-play serves
-        team_a_data = self.team_a_template.copy()
+        team_a_data = self.team_a_template
         team_a_data['serve_probabilities']['ace'] = 0.0
         team_a_data['serve_probabilities']['in_play'] = 1.0
         team_a_data['serve_probabilities']['error'] = 0.0
         
         # Team B: 100% reception errors
-        team_b_data = self.team_b_template.copy()
+        team_b_data = self.team_b_template
         team_b_data['receive_probabilities']['in_play_serve']['excellent'] = 0.0
         team_b_data['receive_probabilities']['in_play_serve']['good'] = 0.0
         team_b_data['receive_probabilities']['in_play_serve']['poor'] = 0.0
@@ -112,13 +122,11 @@ class TestExtremeStatistics(unittest.TestCase):
         team_b = Team.from_dict(team_b_data)
         
         # Simulate multiple points with Team A serving
-        wins_a = 0
         total_points = 100
         
-        for i in range(total_points):
-            result = simulate_point(team_a, team_b, serving_team="A", seed=42 + i)
-            if result.winner == "A":
-                wins_a += 1
+        # Stops early once a loss rules out the 99% threshold
+        wins_a = count_wins_until_decided(team_a, team_b, serving_team="A", winner="A",
+                                          seeds=range(42, 42 + total_points), min_win_rate=0.99)
                 
         win_rate = wins_a / total_points
         self.assertGreaterEqual(win_rate, 0.99, f"Expected ~100% win rate when opponent has 100% reception error, got {win_rate:.2%}")
@@ -126,7 +134,7 @@ class TestExtremeStatistics(unittest.TestCase):
     def test_100_percent_kill_rate_from_excellent_set(self):
         """Test: If team has 100% kill rate from excellent sets and always gets excellent sets"""
         # Team A: Perfect setting and attacking
-        team_a_data = self.team_a_template.copy()
+        team_a_data = self.team_a_template
         team_a_data['serve_probabilities']['ace'] = 0.0
         team_a_data['serve_probabilities']['in_play'] = 1.0
         team_a_data['serve_probabilities']['error'] = 0.0
@@ -150,16 +158,14 @@ class TestExtremeStatistics(unittest.TestCase):
         
         # Team B: Normal stats
         team_a = Team.from_dict(team_a_data)
-        team_b = Team.from_dict(self.team_b_template)
+        team_b = self.team_b
         
         # Simulate multiple points with Team B serving (so Team A receives)
-        wins_a = 0
         total_points = 100
         
-        for i in range(total_points):
-            result = simulate_point(team_a, team_b, serving_team="B", seed=42 + i)
-            if result.winner == "A":
-                wins_a += 1
+        winners, _ = simulate_points_batch(team_a, team_b, serving_team="B",
+                                           seeds=range(42, 42 + total_points))
+        wins_a = winners.count("A")
                 
         win_rate = wins_a / total_points
         # Should win most points when receiving due to perfect sideout
@@ -168,10 +174,10 @@ class TestExtremeStatistics(unittest.TestCase):
     def test_100_percent_block_stuff(self):
         """Test: If team has 100% block stuff rate against power attacks"""
         # Team A: Normal team (will attack and get blocked)
-        team_a_data = self.team_a_template.copy()
+        team_a_data = self.team_a_template
         
         # Team B: 100% stuff blocks (Team B will block Team A's attacks)
-        team_b_data = self.team_b_template.copy()
+        team_b_data = self.team_b_template
         team_b_data['block_probabilities']['power_attack']['stuff'] = 1.0
         team_b_data['block_probabilities']['power_attack']['deflection_to_defense'] = 0.0
         team_b_data['block_probabilities']['power_attack']['deflection_to_attack'] = 0.0
@@ -182,15 +188,11 @@ class TestExtremeStatistics(unittest.TestCase):
         
         # Team B serves, so Team A receives and attacks (getting blocked by Team B)
         total_points = 50
-        team_b_wins = 0
-        stuff_blocks = 0
         
-        for i in range(total_points):
-            result = simulate_point(team_a, team_b, serving_team="B", seed=42 + i)
-            if result.winner == "B":
-                team_b_wins += 1
-            if result.point_type == "stuff":
-                stuff_blocks += 1
+        winners, point_types = simulate_points_batch(team_a, team_b, serving_team="B",
+                                                     seeds=range(42, 42 + total_points))
+        team_b_wins = winners.count("B")
+        stuff_blocks = point_types.count("stuff")
         
         # Team B should win some points due to perfect blocking when Team A attacks
         win_rate = team_b_wins / total_points
@@ -203,13 +205,13 @@ class TestExtremeStatistics(unittest.TestCase):
     def test_alternating_serve_advantage(self):
         """Test: Verify that serving advantage works correctly"""
         # Team A: 50% ace rate
-        team_a_data = self.team_a_template.copy()
+        team_a_data = self.team_a_template
         team_a_data['serve_probabilities']['ace'] = 0.5
         team_a_data['serve_probabilities']['in_play'] = 0.5
         team_a_data['serve_probabilities']['error'] = 0.0
         
         # Team B: 50% ace rate
-        team_b_data = self.team_b_template.copy()
+        team_b_data = self.team_b_template
         team_b_data['serve_probabilities']['ace'] = 0.5
         team_b_data['serve_probabilities']['in_play'] = 0.5
         team_b_data['serve_probabilities']['error'] = 0.0
@@ -218,21 +220,16 @@ class TestExtremeStatistics(unittest.TestCase):
         team_b = Team.from_dict(team_b_data)
         
         # Test with Team A serving
-        wins_a_serving = 0
         total_points = 100
         
-        for i in range(total_points):
-            result = simulate_point(team_a, team_b, serving_team="A", seed=42 + i)
-            if result.winner == "A":
-                wins_a_serving += 1
+        winners, _ = simulate_points_batch(team_a, team_b, serving_team="A",
+                                           seeds=range(42, 42 + total_points))
+        wins_a_serving = winners.count("A")
         
         # Test with Team B serving  
-        wins_a_receiving = 0
-        
-        for i in range(total_points):
-            result = simulate_point(team_a, team_b, serving_team="B", seed=1000 + i)
-            if result.winner == "A":
-                wins_a_receiving += 1
+        winners, _ = simulate_points_batch(team_a, team_b, serving_team="B",
+                                           seeds=range(1000, 1000 + total_points))
+        wins_a_receiving = winners.count("A")
                 
         win_rate_serving = wins_a_serving / total_points
         win_rate_receiving = wins_a_receiving / total_points
@@ -244,13 +241,13 @@ class TestExtremeStatistics(unittest.TestCase):
     def test_zero_probability_edge_case(self):
         """Test: Ensure zero probabilities are handled correctly"""
         # Team with some zero probabilities
-        team_a_data = self.team_a_template.copy()
+        team_a_data = self.team_a_template
         team_a_data['serve_probabilities']['ace'] = 0.0
         team_a_data['serve_probabilities']['in_play'] = 1.0
         team_a_data['serve_probabilities']['error'] = 0.0
         
         team_a = Team.from_dict(team_a_data)
-        team_b = Team.from_dict(self.team_b_template)
+        team_b = self.team_b
         
         # Should not crash and should produce valid results
         results = []
@@ -262,15 +259,15 @@ class TestExtremeStatistics(unittest.TestCase):
         for result in results:
             self.assertIn(result.winner, ["A", "B"])
             self.assertGreater(len(result.states), 0)
-            self.assertIn(result.point_type, ["ace", "error", "kill", "block", "stuff", "attack_error", "dig_error", "set_error"])
+            self.assertIn(result.point_type, VALID_POINT_TYPES)
 
     def test_perfect_dig_chain(self):
         """Test: Perfect dig and counterattack sequence"""
         # Team A: Normal serving
-        team_a = Team.from_dict(self.team_a_template)
+        team_a = self.team_a
         
         # Team B: Perfect digging and counterattack
-        team_b_data = self.team_b_template.copy()
+        team_b_data = self.team_b_template
         team_b_data['dig_probabilities']['deflected_attack']['excellent'] = 1.0
         team_b_data['dig_probabilities']['deflected_attack']['good'] = 0.0
         team_b_data['dig_probabilities']['deflected_attack']['poor'] = 0.0
@@ -299,7 +296,7 @@ class TestExtremeStatistics(unittest.TestCase):
     def test_100_percent_set_error(self):
         """Test: 100% setting errors should prevent attacks"""
         # Team with perfect reception but terrible setting
-        team_a_data = self.team_a_template.copy()
+        team_a_data = self.team_a_template
         team_a_data['serve_probabilities']['ace'] = 0.0
         team_a_data['serve_probabilities']['in_play'] = 1.0
         team_a_data['serve_probabilities']['error'] = 0.0
@@ -316,16 +313,14 @@ class TestExtremeStatistics(unittest.TestCase):
         team_a_data['set_probabilities']['excellent_reception']['error'] = 1.0
         
         team_a = Team.from_dict(team_a_data)
-        team_b = Team.from_dict(self.team_b_template)
+        team_b = self.team_b
         
         # Team A should lose most points when receiving due to set errors
-        wins_a = 0
         total_points = 100
         
-        for i in range(total_points):
-            result = simulate_point(team_a, team_b, serving_team="B", seed=42 + i)
-            if result.winner == "A":
-                wins_a += 1
+        winners, _ = simulate_points_batch(team_a, team_b, serving_team="B",
+                                           seeds=range(42, 42 + total_points))
+        wins_a = winners.count("A")
                 
         win_rate = wins_a / total_points
         # Should lose most points due to setting errors
@@ -334,7 +329,7 @@ class TestExtremeStatistics(unittest.TestCase):
     def test_extreme_attack_error_rate(self):
         """Test: 100% attack errors should result in point loss"""
         # Team with good buildup but terrible attacking
-        team_a_data = self.team_a_template.copy()
+        team_a_data = self.team_a_template
         
         # Perfect attack opportunities
         team_a_data['attack_probabilities']['excellent_set']['kill'] = 0.0
@@ -350,16 +345,14 @@ class TestExtremeStatistics(unittest.TestCase):
         team_a_data['attack_probabilities']['poor_set']['error'] = 1.0
         
         team_a = Team.from_dict(team_a_data)
-        team_b = Team.from_dict(self.team_b_template)
+        team_b = self.team_b
         
         # Simulate points - Team A should lose when it gets to attack
         total_points = 50
-        team_b_wins = 0
         
-        for i in range(total_points):
-            result = simulate_point(team_a, team_b, serving_team="B", seed=42 + i)
-            if result.winner == "B":
-                team_b_wins += 1
+        winners, _ = simulate_points_batch(team_a, team_b, serving_team="B",
+                                           seeds=range(42, 42 + total_points))
+        team_b_wins = winners.count("B")
         
         win_rate_b = team_b_wins / total_points
         # Team B should win more due to Team A's attack errors
@@ -368,20 +361,17 @@ class TestExtremeStatistics(unittest.TestCase):
     def test_probability_normalization(self):
         """Test: Verify probabilities are properly normalized"""
         # This is more of a unit test for the Team class
-        team_data = self.team_a_template.copy()
+        team_data = self.team_a_template
         
         # Verify that probabilities sum to 1.0 (within floating point precision)
-        serve_probs = team_data['serve_probabilities']
-        serve_sum = serve_probs['ace'] + serve_probs['in_play'] + serve_probs['error']
-        self.assertAlmostEqual(serve_sum, 1.0, places=6, 
-                              msg=f"Serve probabilities should sum to 1.0, got {serve_sum}")
-        
-        # Check reception probabilities
-        for serve_type in team_data['receive_probabilities']:
-            recv_probs = team_data['receive_probabilities'][serve_type]
-            recv_sum = recv_probs['excellent'] + recv_probs['good'] + recv_probs['poor'] + recv_probs['error']
-            self.assertAlmostEqual(recv_sum, 1.0, places=6,
-                                  msg=f"Reception probabilities for {serve_type} should sum to 1.0, got {recv_sum}")
+        distributions = {'serve': team_data['serve_probabilities']}
+        for serve_type, recv_probs in team_data['receive_probabilities'].items():
+            distributions[f'receive/{serve_type}'] = recv_probs
+        
+        # Compare every sum in one assertion; the diff names any distribution that is off
+        sums = {name: round(math.fsum(probs.values()), 6) for name, probs in distributions.items()}
+        self.assertEqual(sums, dict.fromkeys(distributions, 1.0),
+                         "Serve and reception probabilities should each sum to 1.0")
 
 
 def run_extreme_tests():
@@ -1,22 +1,35 @@
 #!/usr/bin/env python3
 """Tests that the compare-teams command accepts Basic / Advanced as template identifiers."""
 
+import contextlib
+import io
 import json
-import subprocess
 import sys
 from pathlib import Path
+from types import SimpleNamespace
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'src'))
+
+from bvsim_cli.cli import main
 
 
 def run_cli(args):
-    """Helper to run the bvsim_cli module as a subprocess and capture output."""
-    cmd = [sys.executable, '-m', 'bvsim_cli'] + args
-    result = subprocess.run(cmd, capture_output=True, text=True, check=False)
-    return result
+    """Helper to run the bvsim_cli entry point in-process and capture output."""
+    stdout, stderr = io.StringIO(), io.StringIO()
+    with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+        try:
+            returncode = main(args)
+        except SystemExit as e:
+            # argparse exits on usage errors, like the real process would
+            returncode = e.code
+    return SimpleNamespace(returncode=returncode or 0, stdout=stdout.getvalue(), stderr=stderr.getvalue())
 
 
 def test_compare_teams_basic_advanced_text():
     """Basic smoke test for text output using Basic,Advanced identifiers."""
-    result = run_cli(['compare-teams', '--teams', 'Basic,Advanced', '--points', '10', '--format', 'text'])
+    # Win rates are checked by the JSON test; one point per matchup is enough to render the matrix
+    result = run_cli(['compare-teams', '--teams', 'Basic,Advanced', '--points', '1', '--format', 'text'])
     assert result.returncode == 0, f"Non-zero exit (stderr): {result.stderr}"
     assert 'Team Comparison Matrix' in result.stdout
     assert 'Basic' in result.stdout
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the JSON file helpers.
+Tests that files default to the json module's format, and that opting in to orjson
+keeps the same values and differs only as documented.
+"""
+
+import json
+import math
+import os
+import sys
+import tempfile
+import unittest
+from unittest.mock import patch
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from bvsim_core import json_io
+from bvsim_core.json_io import dump_json_file, load_json_file
+
+
+class TestJsonIO(unittest.TestCase):
+    """Test JSON file helpers with both backends"""
+
+    def setUp(self):
+        self.temp_dir = self.enterContext(tempfile.TemporaryDirectory())
+        self.data = {
+            'team_a_name': 'Zoë',
+            'duration_seconds': 1e-05,
+            'points': [{'winner': 'A', 'duration': 4}, {'winner': 'B', 'duration': 12}],
+            'rankings': []
+        }
+
+    def write(self, data, indent, use_orjson):
+        """Write data with the chosen backend and return the file's bytes"""
+        path = os.path.join(self.temp_dir, f"{'orjson' if use_orjson else 'json'}_{indent}.json")
+        dump_json_file(data, path, indent=indent, use_orjson=use_orjson)
+        with open(path, 'rb') as f:
+            return f.read()
+
+    def test_default_output_is_json_module_output(self):
+        """Files have the json module's bytes whether or not orjson is installed"""
+        for installed in (json_io.orjson, None):
+            with self.subTest(orjson_installed=installed is not None):
+                with patch.object(json_io, 'orjson', installed):
+                    raw = self.write(self.data, True, use_orjson=False)
+                    self.assertEqual(raw, json.dumps(self.data, indent=2).encode())
+                    self.assertEqual(load_json_file(os.path.join(self.temp_dir, 'json_True.json')), self.data)
+
+        # Opting in without orjson installed falls back to the json module
+        with patch.object(json_io, 'orjson', None):
+            self.assertEqual(self.write(self.data, False, use_orjson=True), json.dumps(self.data).encode())
+
+    @unittest.skipIf(json_io.orjson is None, "orjson is not installed")
+    def test_backends_agree_on_values(self):
+        """Either backend can read the other's output, with identical values"""
+        for indent in (False, True):
+            with self.subTest(indent=indent):
+                for use_orjson in (False, True):
+                    raw = self.write(self.data, indent, use_orjson)
+                    self.assertEqual(json.loads(raw), self.data)
+                    self.assertEqual(json_io.orjson.loads(raw), self.data)
+
+    @unittest.skipIf(json_io.orjson is None, "orjson is not installed")
+    def test_documented_byte_differences(self):
+        """orjson output differs from json only in the ways the module documents"""
+        raw = self.write(self.data, True, use_orjson=True)
+        self.assertIn('"Zoë"'.encode(), raw)
+        self.assertIn(b'0.00001', raw)
+        self.assertNotEqual(raw, self.write(self.data, True, use_orjson=False))
+
+        # Compact output drops the spaces after separators
+        self.assertEqual(self.write({'a': [1, 2]}, False, use_orjson=True), b'{"a":[1,2]}')
+
+    def test_non_finite_floats_are_not_lost(self):
+        """NaN is kept by the json module and refused by orjson, never written as null"""
+        raw = self.write({'rates': [math.nan, math.inf]}, False, use_orjson=False)
+        self.assertEqual(raw, b'{"rates": [NaN, Infinity]}')
+        rates = load_json_file(os.path.join(self.temp_dir, 'json_False.json'))['rates']
+        self.assertTrue(math.isnan(rates[0]))
+        self.assertEqual(rates[1], math.inf)
+
+        if json_io.orjson is not None:
+            path = os.path.join(self.temp_dir, 'nan.json')
+            with self.assertRaises(ValueError):
+                dump_json_file({'points': [{'rate': math.nan}]}, path, use_orjson=True)
+            self.assertFalse(os.path.exists(path))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -4,8 +4,10 @@ Unit tests for state machine logic.
 Tests that volleyball simulation follows correct rules and probabilities.
 """
 
+import random
 import unittest
 from collections import Counter
+from dataclasses import asdict
 import sys
 import os
 
@@ -13,17 +15,19 @@ import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
 
 from bvsim_core.team import Team
-from bvsim_core.state_machine import simulate_point, choose_outcome
+from bvsim_core.state_machine import (simulate_point, simulate_point_summary, simulate_points_batch,
+                                      choose_outcome, compile_team)
 from bvsim_core.point import Point, State
 
 
 class TestStateMachine(unittest.TestCase):
     """Test state machine volleyball simulation logic"""
     
-    def setUp(self):
-        """Set up test teams with known probabilities"""
+    @classmethod
+    def setUpClass(cls):
+        """Set up test teams with known probabilities (shared, no test modifies them)"""
         # Team with deterministic serve ace
-        self.ace_team_data = {
+        cls.ace_team_data = {
             'name': 'Ace Team',
             'serve_probabilities': {'ace': 1.0, 'in_play': 0.0, 'error': 0.0},
             'receive_probabilities': {
@@ -44,7 +48,7 @@ class TestStateMachine(unittest.TestCase):
         }
         
         # Team with deterministic serve error
-        self.error_team_data = {
+        cls.error_team_data = {
             'name': 'Error Team', 
             'serve_probabilities': {'ace': 0.0, 'in_play': 0.0, 'error': 1.0},
             'receive_probabilities': {
@@ -65,7 +69,7 @@ class TestStateMachine(unittest.TestCase):
         }
         
         # Team with in-play serves leading to kills
-        self.kill_team_data = {
+        cls.kill_team_data = {
             'name': 'Kill Team',
             'serve_probabilities': {'ace': 0.0, 'in_play': 1.0, 'error': 0.0},
             'receive_probabilities': {
@@ -86,7 +90,7 @@ class TestStateMachine(unittest.TestCase):
         }
         
         # Team with attack errors 
-        self.attack_error_team_data = {
+        cls.attack_error_team_data = {
             'name': 'Attack Error Team',
             'serve_probabilities': {'ace': 0.0, 'in_play': 1.0, 'error': 0.0},
             'receive_probabilities': {
@@ -106,15 +110,13 @@ class TestStateMachine(unittest.TestCase):
             }
         }
         
-        self.ace_team = Team.from_dict(self.ace_team_data)
-        self.error_team = Team.from_dict(self.error_team_data)
-        self.kill_team = Team.from_dict(self.kill_team_data)
-        self.attack_error_team = Team.from_dict(self.attack_error_team_data)
+        cls.ace_team = Team.from_dict(cls.ace_team_data)
+        cls.error_team = Team.from_dict(cls.error_team_data)
+        cls.kill_team = Team.from_dict(cls.kill_team_data)
+        cls.attack_error_team = Team.from_dict(cls.attack_error_team_data)
     
     def test_choose_outcome_probability_distribution(self):
         """Test that choose_outcome respects probability distributions"""
-        import random
-        
         # Test with known seed for reproducibility
         rng = random.Random(12345)
         
@@ -129,6 +131,52 @@ class TestStateMachine(unittest.TestCase):
         self.assertGreater(counter['B'], 400)
         self.assertLess(counter['B'], 600)
     
+    def test_compiled_tables_follow_team_probabilities(self):
+        """Test that compile_team keeps outcome order and cumulative bounds"""
+        team_data = dict(self.attack_error_team_data)
+        team_data['serve_probabilities'] = {'ace': 0.25, 'in_play': 0.0, 'error': 0.75}
+        tables = compile_team(Team.from_dict(team_data))
+        
+        # Zero-probability outcomes are dropped from the tables
+        self.assertEqual(tables.serve, (('ace', 'error'), (0.25, 1.0)))
+        
+        # Certain outcomes have no cumulative bounds: nothing to draw
+        self.assertEqual(tables.attack_by_quality['excellent'], (('error',), ()))
+        self.assertEqual(tables.block, (('no_touch',), ()))
+        
+        # Conditions the team leaves out are not compiled; the state machine
+        # falls back to its default distributions for them
+        self.assertNotIn('good', tables.attack_by_quality)
+    
+    def test_probability_changes_reach_compiled_tables(self):
+        """Test that a team cannot keep simulating with tables compiled from stale probabilities"""
+        team_data = dict(self.kill_team_data)
+        team_data['serve_probabilities'] = {'ace': 0.0, 'in_play': 0.0, 'error': 1.0}
+        team = Team.from_dict(team_data)
+        self.assertEqual(simulate_point(team, self.kill_team, serving_team="A", seed=1).point_type, "serve_error")
+        
+        # Editing a distribution in place recompiles the tables
+        team.serve_probabilities['ace'] = 1.0
+        team.serve_probabilities['error'] = 0.0
+        self.assertEqual(simulate_point(team, self.kill_team, serving_team="A", seed=1).point_type, "ace")
+        
+        # So does assigning a new distribution
+        team.serve_probabilities = {'ace': 0.0, 'in_play': 0.0, 'error': 1.0}
+        winners, _ = simulate_points_batch(team, self.kill_team, serving_team="A", seeds=[1])
+        self.assertEqual(winners, ["B"])
+        
+        # The cache is not part of the dataclass's fields
+        self.assertEqual(Team(**asdict(team)), team)
+    
+    def test_certain_outcomes_do_not_consume_random_numbers(self):
+        """Test that a point made only of certain outcomes leaves the generator untouched"""
+        rng = random.Random(12345)
+        state_before = rng.getstate()
+        point = simulate_point(self.ace_team, self.kill_team, serving_team="A", rng=rng)
+        
+        self.assertEqual(point.point_type, "ace")
+        self.assertEqual(rng.getstate(), state_before)
+    
     def test_serve_ace_ends_point_immediately(self):
         """Test that serve ace ends the point immediately"""
         point = simulate_point(self.ace_team, self.kill_team, serving_team="A", seed=12345)
@@ -142,6 +190,14 @@ class TestStateMachine(unittest.TestCase):
         self.assertEqual(point.states[0].action, "serve")
         self.assertEqual(point.states[0].quality, "ace")
     
+    def test_outcome_names_are_interned(self):
+        """Test that states share interned outcome names even for YAML-loaded teams"""
+        yaml_team = Team.from_yaml(Team.from_dict({'name': 'YAML Team'}).to_yaml())
+        point = simulate_point(yaml_team, yaml_team, serving_team="A", seed=7)
+        
+        for state in point.states:
+            self.assertIs(state.quality, sys.intern(state.quality))
+    
     def test_serve_error_ends_point_immediately(self):
         """Test that serve error ends the point immediately"""
         point = simulate_point(self.error_team, self.kill_team, serving_team="A", seed=12345)
@@ -224,6 +280,44 @@ class TestStateMachine(unittest.TestCase):
             self.assertEqual(s1.action, s2.action)
             self.assertEqual(s1.quality, s2.quality)
     
+    def test_explicit_rng_matches_seed(self):
+        """Test that passing a generator is equivalent to passing its seed"""
+        # Omitted sections fall back to the Basic template's distributions
+        default_team = Team.from_dict({'name': 'Default Team'})
+        
+        for seed in range(20):
+            seeded = simulate_point(default_team, default_team, serving_team="B", seed=seed)
+            shared = simulate_point(default_team, default_team, serving_team="B",
+                                    rng=random.Random(seed))
+            self.assertEqual(seeded, shared)
+    
+    def test_summary_matches_full_simulation(self):
+        """Test that simulate_point_summary picks the same winner as simulate_point"""
+        default_team = Team.from_dict({'name': 'Default Team'})
+        
+        for seed in range(200):
+            serving_team = "A" if seed % 2 == 0 else "B"
+            point = simulate_point(default_team, self.kill_team, serving_team=serving_team, seed=seed)
+            winner = simulate_point_summary(default_team, self.kill_team, serving_team=serving_team, seed=seed)
+            self.assertEqual(winner, point.winner)
+    
+    def test_batch_matches_individual_points(self):
+        """Test that simulate_points_batch reproduces simulate_point seed by seed"""
+        default_team = Team.from_dict({'name': 'Default Team'})
+        seeds = range(100, 300)
+        
+        winners, point_types = simulate_points_batch(default_team, self.kill_team,
+                                                     serving_team="A", seeds=seeds)
+        
+        self.assertEqual(len(winners), len(seeds))
+        for seed, winner, point_type in zip(seeds, winners, point_types):
+            point = simulate_point(default_team, self.kill_team, serving_team="A", seed=seed)
+            self.assertEqual((winner, point_type), (point.winner, point.point_type))
+        
+        # Seeds are required rather than silently defaulting to an empty batch
+        with self.assertRaises(TypeError):
+            simulate_points_batch(default_team, self.kill_team, "A")
+    
     def test_different_seeds_produce_different_results(self):
         """Test that different seeds can produce different outcomes"""
         # Use teams with realistic probabilities for variation
@@ -249,14 +343,12 @@ class TestStateMachine(unittest.TestCase):
         realistic_team = Team.from_dict(realistic_team_data)
         
         # Simulate multiple points with different seeds
-        points = []
-        for seed in range(100):
-            point = simulate_point(realistic_team, realistic_team, serving_team="A", seed=seed)
-            points.append(point)
+        winners, point_types = simulate_points_batch(realistic_team, realistic_team, serving_team="A",
+                                                     seeds=range(100))
         
         # Should see variety in outcomes
-        point_types = set(p.point_type for p in points)
-        winners = set(p.winner for p in points)
+        point_types = set(point_types)
+        winners = set(winners)
         
         # Should have multiple point types and both teams winning
         self.assertGreater(len(point_types), 1, "Should see variety in point types")
@@ -293,13 +385,15 @@ class TestStateMachine(unittest.TestCase):
         
         conditional_team = Team.from_dict(conditional_team_data)
         
-        # Simulate many points to see conditional effects
+        # Simulate many points to see conditional effects; one seeded generator
+        # shared by all points instead of seeding a new one per point
+        rng = random.Random(12345)
         excellent_kills = 0
         good_kills = 0
         poor_kills = 0
         
-        for seed in range(1000):
-            point = simulate_point(conditional_team, conditional_team, serving_team="A", seed=seed)
+        for _ in range(1000):
+            point = simulate_point(conditional_team, conditional_team, serving_team="A", rng=rng)
             
             # Only count points that reach attack phase (4 states: serve, receive, set, attack)
             if len(point.states) >= 4:
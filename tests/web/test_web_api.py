@@ -10,6 +10,35 @@ def client():
     with app.test_client() as c:
         yield c
 
+
+def team_file(name):
+    """File name the create-team endpoint writes for a team name"""
+    return f"team_{name.lower().replace(' ', '_')}.yaml"
+
+
+@pytest.fixture
+def make_team(client, request):
+    """Create Basic-template teams owned by the calling test and delete them afterwards.
+
+    Names are derived from the test name (and keep the hidden 'webtestteam'
+    fragment), so tests do not depend on each other's teams and can run in
+    any order or on separate workers.
+    """
+    created = []
+
+    def make(suffix=""):
+        name = f"WebTestTeam_{request.node.name}{suffix}"
+        rv = client.post('/api/teams', json={"name": name, "template": "basic", "overwrite": True})
+        assert rv.status_code == 200, rv.data
+        data = rv.get_json()
+        assert data.get('created')
+        created.append(data['file'])
+        return name
+
+    yield make
+    for file in created:
+        client.delete(f'/api/teams/{file}')
+
 def test_version(client):
     rv = client.get('/api/version')
     assert rv.status_code == 200
@@ -17,24 +46,21 @@ def test_version(client):
     assert 'version' in data
 
 
-def test_create_team_and_list(client):
-    # Use overwrite to make test idempotent if file persists from earlier test run
-    rv = client.post('/api/teams', json={"name": "WebTestTeam", "template": "basic", "overwrite": True})
-    assert rv.status_code == 200, rv.data
-    data = rv.get_json()
-    assert data.get('created')
+def test_create_team_and_list(client, make_team, monkeypatch):
+    # make_team posts the create request and asserts the team was created
+    name = make_team()
     # Enable inclusion of test teams in list endpoint
-    import os
-    os.environ['BVSIM_INCLUDE_TEST_TEAMS'] = '1'
+    monkeypatch.setenv('BVSIM_INCLUDE_TEST_TEAMS', '1')
     # list
     rv2 = client.get('/api/teams')
     assert rv2.status_code == 200
     names = [t.get('name') for t in rv2.get_json().get('teams', [])]
-    assert any('WebTestTeam' in (n or '') for n in names)
+    assert name in names
 
 
-def test_simulate_quick(client):
-    rv = client.post('/api/simulate', json={"team_a": "WebTestTeam", "team_b": "WebTestTeam", "quick": True})
+def test_simulate_quick(client, make_team):
+    name = make_team()
+    rv = client.post('/api/simulate', json={"team_a": name, "team_b": name, "quick": True})
     assert rv.status_code == 200, rv.data
     data = rv.get_json()
     assert 'summary' in data
@@ -49,11 +75,10 @@ def test_simulate_blank_defaults(client):
     assert data['parameters'].get('used_defaults') is True
     assert data['summary']['team_a_win_rate'] >= 0
 
-def test_simulate_one_blank_other_basic(client):
+def test_simulate_one_blank_other_basic(client, make_team):
     # Provide only team_a, leave team_b blank -> team_b should be Basic (not Advanced)
-    rv = client.post('/api/teams', json={"name": "SoloTeamX", "template": "basic", "overwrite": True})
-    assert rv.status_code == 200
-    rv2 = client.post('/api/simulate', json={"team_a": "tests/data/teams/team_soloteamx.yaml", "team_b": "", "quick": True})
+    name = make_team()
+    rv2 = client.post('/api/simulate', json={"team_a": f"tests/data/teams/{team_file(name)}", "team_b": "", "quick": True})
     assert rv2.status_code == 200, rv2.data
     data = rv2.get_json()
     assert data['parameters'].get('used_defaults') is True
@@ -68,18 +93,19 @@ def test_skills_blank_defaults(client):
     assert data['teams']['team'] == 'Team A'
     assert data['teams']['opponent'] == 'Team B'
 
-def test_skills_one_blank_other_basic(client):
-    rv = client.post('/api/skills', json={"team": "tests/data/teams/team_soloteamx.yaml", "quick": True})
+def test_skills_one_blank_other_basic(client, make_team):
+    name = make_team()
+    rv = client.post('/api/skills', json={"team": f"tests/data/teams/{team_file(name)}", "quick": True})
     assert rv.status_code == 200
     data = rv.get_json()
     # Opponent blank -> Basic template Team B
     assert data['teams']['opponent'] == 'Team B'
 
 
-def test_compare(client):
+def test_compare(client, make_team):
     # Ensure at least two teams exist
-    client.post('/api/teams', json={"name": "WebTestTeam2", "template": "basic"})
-    rv = client.post('/api/compare', json={"teams": ["WebTestTeam", "WebTestTeam2"], "quick": True})
+    teams = [make_team("_1"), make_team("_2")]
+    rv = client.post('/api/compare', json={"teams": teams, "quick": True})
     assert rv.status_code == 200
     data = rv.get_json()
     assert 'results' in data
@@ -99,22 +125,22 @@ def test_compare_defaults_when_empty(client):
     assert data['parameters'].get('used_defaults') is True
     assert 'results' in data
 
-def test_compare_single_defaults_other(client):
-    rv = client.post('/api/compare', json={"teams": ["WebTestTeam"]})
+def test_compare_single_defaults_other(client, make_team):
+    rv = client.post('/api/compare', json={"teams": [make_team()]})
     assert rv.status_code == 200
     data = rv.get_json()
     assert data['parameters'].get('used_defaults') is True
 
 
-def test_examples(client):
-    rv = client.post('/api/examples', json={"team_a": "WebTestTeam", "team_b": "WebTestTeam2", "count": 3})
+def test_examples(client, make_team):
+    rv = client.post('/api/examples', json={"team_a": make_team("_1"), "team_b": make_team("_2"), "count": 3})
     assert rv.status_code == 200
     data = rv.get_json()
     assert 'rallies' in data and len(data['rallies']) == 3
 
 
-def test_skills_quick(client):
-    rv = client.post('/api/skills', json={"team": "WebTestTeam", "quick": True, "improve": "5%"})
+def test_skills_quick(client, make_team):
+    rv = client.post('/api/skills', json={"team": make_team(), "quick": True, "improve": "5%"})
     assert rv.status_code == 200
     data = rv.get_json()
     assert 'results' in data